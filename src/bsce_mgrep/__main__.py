@@ -13,12 +13,12 @@ from bsce_mgrep.cli.runner import run
 
 def main() -> int:
     """Main entry point for the CLI.
-    
+
     Parses arguments, executes pipeline, and returns exit code.
-    
+
     Returns:
         0 on success, 1 on error
-        
+
     Side Effects:
         - Reads from stdin or file
         - Writes to stdout (matches)
@@ -27,7 +27,7 @@ def main() -> int:
     """
     # Parse CLI arguments
     args_result = parse_args()
-    
+
     match args_result:
         case Err(error):
             if error != "Help requested":
@@ -35,10 +35,10 @@ def main() -> int:
             return 1
         case Ok(args):
             pass
-    
+
     # Execute pipeline
     run_result = run(args)
-    
+
     match run_result:
         case Ok(_):
             return 0
@@ -4,60 +4,265 @@ This module implements the SourceReader protocol for reading from files.
 Handles common file errors gracefully using Railway-Oriented Programming.
 """
 
+import mmap
+import os
 from dataclasses import dataclass
-from typing import Iterator
-from result import Ok, Err
+from itertools import pairwise
+from typing import BinaryIO, Callable, Iterator
+from result import Result, Ok, Err
 
-from bsce_mgrep.domain.types import Line, LineResult
+from bsce_mgrep.adapters.input.line_splitter import (
+    decode_blocks, iter_chunks, split_blocks, split_lines, strip_cr
+)
+from bsce_mgrep.domain.types import Line, LineBatch, LineResult
+
+# Files at least this large are memory-mapped instead of read in chunks
+MMAP_THRESHOLD = 64 << 20  # 64 MiB
+
+# Files at least this large get a sequential-access readahead hint
+READAHEAD_THRESHOLD = 8 << 20  # 8 MiB
 
 
 @dataclass(frozen=True, slots=True)
 class FileReader:
     """Adapter for reading lines from a file.
-    
+
     Implements the SourceReader protocol. Handles common file errors:
     - File not found
     - Permission denied
     - I/O errors during reading
-    
+
     Attributes:
         filepath: Path to the file to read
-        
+        start: Byte offset to start reading at (must be a line start)
+        end: Byte offset to stop reading at (None reads to end of file)
+
+    Note:
+        When a byte range is given, line numbers restart at 1 at `start`.
+
     Examples:
         >>> reader = FileReader(filepath="test.log")
         >>> lines = reader.read_lines()
         >>> # Yields LineResult objects
     """
     filepath: str
-    
+    start: int = 0
+    end: int | None = None
+
     def read_lines(self) -> Iterator[LineResult]:
         """Read lines from file.
-        
-        Opens file, reads line by line, and yields LineResult objects.
+
+        Opens file in binary mode, reads it in large chunks (or memory-maps
+        it when large), splits on newlines and decodes each line as UTF-8.
         Errors are yielded as Err values, not raised as exceptions.
-        
+
         Yields:
             Ok(Line) for each successfully read line
             Err(str) if file cannot be opened or read
-            
+
         Note:
             Line numbers start at 1 (not 0).
-            Trailing newlines are stripped from content.
+            Trailing newlines (\n or \r\n) are stripped from content.
         """
+        match self._open():
+            case Err(error):
+                yield Err(error)
+                return
+            case Ok(file):
+                pass
+
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as file:
-                for line_number, content in enumerate(file, start=1):
-                    yield Ok(Line(
-                        number=line_number,
-                        content=content.rstrip('\n\r')
-                    ))
-        except FileNotFoundError:
-            yield Err(f"File not found: {self.filepath}")
-        except PermissionError:
-            yield Err(f"Permission denied: {self.filepath}")
-        except IsADirectoryError:
-            yield Err(f"Is a directory: {self.filepath}")
+            for line in self._iter(file):
+                yield Ok(line)
         except IOError as e:
             yield Err(f"Read error: {e}")
         except UnicodeDecodeError as e:
             yield Err(f"Encoding error: {e}")
+
+    def iter_lines(self) -> Result[Iterator[Line], str]:
+        """Open the file once and return an iterator of bare Lines.
+
+        Unboxed variant of read_lines for the hot path: open errors are
+        returned as Err up front, and no Result is allocated per line.
+
+        Returns:
+            Ok(iterator of Line) or Err(message) if the file cannot be opened
+
+        Raises:
+            IOError, UnicodeDecodeError: While iterating, on read/decode failure
+        """
+        return self._open().map(self._iter)
+
+    def iter_line_batches(self) -> Result[Iterator[LineBatch], str]:
+        """Open the file once and return an iterator of LineBatches.
+
+        Reads whole-line blocks and decodes each with one call (see
+        decode_blocks), so no per-line split, decode or Line is paid for.
+
+        Returns:
+            Ok(iterator of LineBatch) or Err(message) if the file cannot be opened
+
+        Raises:
+            IOError, UnicodeDecodeError: While iterating, on read/decode failure
+        """
+        return self._open().map(lambda file: decode_blocks(self._iter_blocks(file), self.decode))
+
+    def iter_blocks(self) -> Result[Iterator[bytes], str]:
+        """Open the file once and return an iterator of raw line blocks.
+
+        Used by bulk scanners that search many lines per call; see
+        split_blocks. Nothing is decoded here - use decode() on the lines
+        that are actually needed.
+
+        Returns:
+            Ok(iterator of byte blocks) or Err(message) if the file cannot be opened
+
+        Raises:
+            IOError: While iterating, on read failure
+        """
+        return self._open().map(self._iter_blocks)
+
+    @property
+    def encoding(self) -> str:
+        """Encoding used to decode file content."""
+        return 'utf-8'
+
+    def decode(self, raw: bytes) -> str:
+        """Decode one raw line the same way read_lines does."""
+        return raw.decode('utf-8')
+
+    def shard_ranges(self, count: int) -> list[tuple[int, int]]:
+        """Split the file into up to `count` byte ranges aligned to line starts.
+
+        Each boundary is moved forward to the start of the next line, so every
+        line belongs to exactly one range. Empty ranges are dropped.
+
+        Args:
+            count: Desired number of ranges
+
+        Returns:
+            Consecutive (start, end) byte offsets covering the whole file
+
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        with open(self.filepath, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            offsets = [0]
+
+            for index in range(1, count):
+                # Step back one byte so a boundary already on a line start is kept
+                file.seek(max(index * size // count - 1, offsets[-1]))
+                file.readline()
+                offsets.append(file.tell())
+
+        offsets.append(size)
+        return [(start, end) for start, end in pairwise(offsets) if start < end]
+
+    def _open(self) -> Result[BinaryIO, str]:
+        """Open the file for unbuffered binary reading."""
+        try:
+            return Ok(open(self.filepath, 'rb', buffering=0))
+        except FileNotFoundError:
+            return Err(f"File not found: {self.filepath}")
+        except PermissionError:
+            return Err(f"Permission denied: {self.filepath}")
+        except IsADirectoryError:
+            return Err(f"Is a directory: {self.filepath}")
+        except OSError as e:
+            return Err(f"Read error: {e}")
+
+    def _iter(self, file: BinaryIO) -> Iterator[Line]:
+        """Yield decoded Lines from an open file, closing it when done."""
+        with file:
+            fd = file.fileno()
+            end = os.fstat(fd).st_size if self.end is None else self.end
+
+            if end - self.start >= MMAP_THRESHOLD:
+                raw_lines = _iter_mapped_lines(fd, self.start, end)
+            else:
+                raw_lines = split_lines(iter_chunks(self._reader(fd)))
+
+            for line_number, raw in enumerate(raw_lines, start=1):
+                yield Line(
+                    line_number,
+                    raw.decode('utf-8')
+                )
+
+    def _iter_blocks(self, file: BinaryIO) -> Iterator[bytes]:
+        """Yield whole-line byte blocks from an open file, closing it when done."""
+        with file:
+            yield from split_blocks(iter_chunks(self._reader(file.fileno())))
+
+    def _reader(self, fd: int) -> Callable[[int], bytes]:
+        """Return a read function limited to this reader's byte range."""
+        _advise_sequential(fd, self.start, self.end)
+
+        if self.start == 0 and self.end is None:
+            return lambda size: os.read(fd, size)
+
+        position = self.start
+        end = self.end
+
+        def read_range(size: int) -> bytes:
+            """Read up to `size` bytes without going past `end`."""
+            nonlocal position
+            if end is not None:
+                size = min(size, end - position)
+            data = os.pread(fd, size, position)
+            position += len(data)
+            return data
+
+        return read_range
+
+def _iter_mapped_lines(fd: int, start: int, end: int) -> Iterator[bytes]:
+    """Yield raw lines from a byte range of a memory-mapped file.
+
+    Newlines are located with mmap.find, so the file is never copied into a
+    user-space read buffer; only each line's own bytes are materialized.
+
+    Args:
+        fd: Open file descriptor of a non-empty regular file
+        start: Byte offset of the first line
+        end: Byte offset to stop at
+
+    Yields:
+        Raw line content without the trailing newline (or CRLF)
+    """
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            # Aggressive readahead, and pages behind the scan can be dropped early
+            mapped.madvise(mmap.MADV_SEQUENTIAL, start - start % mmap.PAGESIZE)
+
+        find = mapped.find
+
+        # One scan decides whether any line can end in \r at all
+        if find(b'\r', start, end) < 0:
+            while (stop := find(b'\n', start, end)) >= 0:
+                yield mapped[start:stop]
+                start = stop + 1
+        else:
+            while (stop := find(b'\n', start, end)) >= 0:
+                yield strip_cr(mapped[start:stop])
+                start = stop + 1
+
+        if start < end:
+            yield strip_cr(mapped[start:end])
+
+def _advise_sequential(fd: int, start: int, end: int | None) -> None:
+    """Hint the kernel that a large byte range will be read once, in order.
+
+    Lets the page cache read ahead more aggressively on cold files (doubling
+    the readahead window on Linux), so fewer reads block on the device.
+    A no-op for small files, on platforms without posix_fadvise, and on
+    descriptors that do not support it (e.g. pipes).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        if os.fstat(fd).st_size >= READAHEAD_THRESHOLD:
+            length = 0 if end is None else end - start
+            os.posix_fadvise(fd, start, length, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
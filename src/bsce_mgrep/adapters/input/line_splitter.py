@@ -0,0 +1,235 @@
+"""Bulk line splitting for input adapters.
+
+This module turns large raw byte chunks into individual lines. Readers pull
+big blocks from the OS and split them here instead of paying the per-line
+overhead of Python's buffered readline machinery.
+"""
+
+from collections.abc import Callable, Iterator
+
+from bsce_mgrep.domain.types import LineBatch
+
+# Number of bytes requested from the OS per read call
+READ_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+def iter_chunks(read: Callable[[int], bytes], size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield raw chunks from a read function until end of input.
+
+    Args:
+        read: Function returning up to `size` bytes (b"" at end of input)
+        size: Number of bytes to request per call
+
+    Yields:
+        Non-empty byte chunks in input order
+
+    Examples:
+        >>> import io
+        >>> list(iter_chunks(io.BytesIO(b"abcdef").read, size=4))
+        [b'abcd', b'ef']
+    """
+    while chunk := read(size):
+        yield chunk
+
+def split_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Split a stream of byte chunks into lines.
+
+    Lines are delimited by b"\\n", which is removed together with a preceding
+    b"\\r" (CRLF endings). A line spanning several chunks is reassembled; a
+    final line without a trailing newline is still yielded. A lone b"\\r"
+    is not a line break (unlike text-mode universal newlines) and is kept
+    in the line.
+
+    Carriage returns are handled per chunk: chunks without any b"\\r" (the
+    usual case) pay a single C-level scan instead of a per-line strip.
+
+    Args:
+        chunks: Iterator of raw byte chunks
+
+    Yields:
+        Raw line content without the trailing newline
+
+    Examples:
+        >>> list(split_lines(iter([b"ERROR: a\\nINF", b"O: b\\r\\n", b"tail"])))
+        [b'ERROR: a', b'INFO: b', b'tail']
+        >>> list(split_lines(iter([b"a\\rb\\r\\n"])))
+        [b'a\\rb']
+    """
+    # Pieces of a line that has not seen its newline yet
+    pending: list[bytes] = []
+
+    for chunk in chunks:
+        lines = chunk.split(b'\n')
+
+        if len(lines) == 1:
+            # No newline in this chunk - keep accumulating
+            pending.append(chunk)
+            continue
+
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b''.join(pending)
+            pending = []
+
+        # Last piece is the start of the next line (empty if chunk ended in \n)
+        tail = lines.pop()
+        if tail:
+            pending.append(tail)
+
+        # A \r before a newline is either in this chunk or ended the previous one
+        if b'\r' in chunk or lines[0].endswith(b'\r'):
+            lines = [strip_cr(line) for line in lines]
+
+        yield from lines
+
+    if pending:
+        yield strip_cr(b''.join(pending))
+
+def split_blocks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Regroup a stream of byte chunks into blocks of whole lines.
+
+    Each yielded block ends right after a b"\\n" (except possibly the last
+    one), so no line straddles two blocks. Lines are left unsplit, which lets
+    bulk scanners search a whole block with a single C-level call.
+
+    Args:
+        chunks: Iterator of raw byte chunks
+
+    Yields:
+        Non-empty byte blocks made of whole lines, in input order
+
+    Examples:
+        >>> list(split_blocks(iter([b"a\\nb", b"c\\nd"])))
+        [b'a\\n', b'bc\\n', b'd']
+    """
+    # Bytes after the last newline seen so far
+    pending: list[bytes] = []
+
+    for chunk in chunks:
+        cut = chunk.rfind(b'\n') + 1
+
+        if not cut:
+            # No newline in this chunk - keep accumulating
+            pending.append(chunk)
+            continue
+
+        if pending:
+            pending.append(chunk[:cut])
+            yield b''.join(pending)
+            pending = []
+        else:
+            yield chunk if cut == len(chunk) else chunk[:cut]
+
+        if cut < len(chunk):
+            pending.append(chunk[cut:])
+
+    if pending:
+        yield b''.join(pending)
+
+def decode_blocks(blocks: Iterator[bytes], decode: Callable[[bytes], str]) -> Iterator[LineBatch]:
+    """Decode whole-line blocks (see split_blocks) into LineBatches.
+
+    Each block is decoded with one call and split into lines with one
+    str.split, instead of one split, strip and decode per line. The result
+    equals decoding line by line for encodings in which b"\\n" is always a
+    newline character on its own (e.g. UTF-8); other encodings should be
+    decoded per line.
+
+    On a decoding error, the lines before the offending one are still
+    yielded, then the error of that line is raised, as line-by-line
+    decoding would.
+
+    Args:
+        blocks: Iterator of byte blocks made of whole lines
+        decode: Decoder for raw bytes
+
+    Yields:
+        One LineBatch per non-empty block, numbered from 1
+
+    Examples:
+        >>> batches = decode_blocks(iter([b"a\\r\\nb\\n", b"c"]), bytes.decode)
+        >>> [tuple(batch.contents) for batch in batches]
+        [('a', 'b'), ('c',)]
+    """
+    # Number of the first line of the next block
+    first = 1
+
+    for block in blocks:
+        try:
+            contents = decode(block).split('\n')
+        except UnicodeDecodeError:
+            # Redo the block line by line to find the offending line
+            contents = []
+            for raw in block.split(b'\n'):
+                try:
+                    contents.append(decode(strip_cr(raw)))
+                except UnicodeDecodeError:
+                    if contents:
+                        yield LineBatch(range(first, first + len(contents)), contents)
+                    raise
+            raise
+
+        if block.endswith(b'\n'):
+            # Nothing follows the last newline
+            contents.pop()
+
+        # One scan decides whether any line can end in \r at all
+        if b'\r' in block:
+            contents = [line[:-1] if line.endswith('\r') else line for line in contents]
+
+        yield LineBatch(range(first, first + len(contents)), contents)
+        first += len(contents)
+
+def check_blocks(blocks: Iterator[bytes], decode: Callable[[bytes], str]) -> Iterator[bytes]:
+    """Pass on whole-line blocks (see split_blocks) after checking they decode.
+
+    For scanners that decode only the lines they match, so that an
+    undecodable line is reported even when it does not match. ASCII blocks
+    (the usual case) are accepted after one C-level isascii scan; any other
+    block is decoded once and the text discarded.
+
+    On a decoding error, the lines before the offending one are still
+    passed on, then the error of that line is raised, as in decode_blocks.
+
+    Args:
+        blocks: Iterator of byte blocks made of whole lines
+        decode: Decoder for raw bytes
+
+    Yields:
+        The blocks, unchanged (the last one cut before an offending line)
+
+    Examples:
+        >>> checked = check_blocks(iter([b"a\\n", b"b\\n\\xff\\n"]), bytes.decode)
+        >>> next(checked), next(checked)
+        (b'a\\n', b'b\\n')
+        >>> next(checked)
+        Traceback (most recent call last):
+        ...
+        UnicodeDecodeError: 'utf-8' codec can't decode byte 0xff in position 0: invalid start byte
+    """
+    for block in blocks:
+        if not block.isascii():
+            try:
+                decode(block)
+            except UnicodeDecodeError:
+                # Redo the block line by line to find the offending line
+                start = 0
+                for raw in block.split(b'\n'):
+                    try:
+                        decode(strip_cr(raw))
+                    except UnicodeDecodeError:
+                        if start:
+                            yield block[:start]
+                        raise
+                    start += len(raw) + 1
+                raise
+
+        yield block
+
+def strip_cr(line: bytes) -> bytes:
+    """Remove a single trailing carriage return, if present.
+
+    Examples:
+        >>> strip_cr(b"ERROR\\r")
+        b'ERROR'
+    """
+    return line[:-1] if line.endswith(b'\r') else line
@@ -6,53 +6,143 @@ Handles stdin errors gracefully using Railway-Oriented Programming.
 
 import sys
 from dataclasses import dataclass
-from typing import Iterator
-from result import Ok, Err
+from io import BufferedReader
+from typing import Iterator, cast
+from result import Result, Ok, Err
 
-from bsce_mgrep.domain.types import Line, LineResult
+from bsce_mgrep.adapters.input.line_splitter import (
+    decode_blocks, iter_chunks, split_blocks, split_lines
+)
+from bsce_mgrep.domain.types import Line, LineBatch, LineResult
+
+
+def _stdin_buffer() -> BufferedReader:
+    """Return the binary buffer under sys.stdin.
+
+    Typed as BinaryIO, but a BufferedReader (with read1) for a real stdin.
+    """
+    return cast(BufferedReader, sys.stdin.buffer)
 
 
 @dataclass(frozen=True, slots=True)
 class StdinReader:
     """Adapter for reading lines from stdin.
-    
+
     Implements the SourceReader protocol. Handles stdin I/O errors gracefully.
-    
+
     Examples:
         >>> reader = StdinReader()
         >>> lines = reader.read_lines()
         >>> # Yields LineResult objects from stdin
     """
-    
+
     def read_lines(self) -> Iterator[LineResult]:
         """Read lines from stdin.
-        
-        Reads from sys.stdin line by line and yields LineResult objects.
-        Errors are yielded as Err values, not raised as exceptions.
-        
+
+        Reads sys.stdin.buffer in large chunks, splits on newlines and decodes
+        each line with the stdin encoding. Errors are yielded as Err values,
+        not raised as exceptions.
+
         Yields:
             Ok(Line) for each successfully read line
             Err(str) if stdin cannot be read
-            
+
         Note:
             Line numbers start at 1 (not 0).
-            Trailing newlines are stripped from content.
+            Trailing newlines (\n or \r\n) are stripped from content.
             Handles BrokenPipeError gracefully (e.g., when piped to head).
         """
         try:
-            for line_number, content in enumerate(sys.stdin, start=1):
-                yield Ok(Line(
-                    number=line_number,
-                    content=content.rstrip('\n\r')
-                ))
-        except BrokenPipeError:
-            # This is normal when piping to commands like head
-            # that close the pipe early - not an error
-            pass
+            for line in self._iter():
+                yield Ok(line)
         except IOError as e:
             yield Err(f"Stdin read error: {e}")
         except UnicodeDecodeError as e:
             yield Err(f"Stdin encoding error: {e}")
+
+    def iter_lines(self) -> Result[Iterator[Line], str]:
+        """Return an iterator of bare Lines from stdin.
+
+        Unboxed variant of read_lines for the hot path: no Result is
+        allocated per line.
+
+        Returns:
+            Ok(iterator of Line) (stdin needs no opening, so never Err)
+
+        Raises:
+            IOError, UnicodeDecodeError: While iterating, on read/decode failure
+        """
+        return Ok(self._iter())
+
+    def iter_line_batches(self) -> Result[Iterator[LineBatch], str]:
+        """Return an iterator of LineBatches from stdin.
+
+        Each batch holds the lines available in one read (see
+        decode_blocks), so streaming input is not held back to fill a
+        batch. Only equal to iter_lines for encodings in which b"\\n" is
+        always a newline on its own, such as UTF-8.
+
+        Returns:
+            Ok(iterator of LineBatch) (stdin needs no opening, so never Err)
+
+        Raises:
+            IOError, UnicodeDecodeError: While iterating, on read/decode failure
+        """
+        return Ok(decode_blocks(self._iter_blocks(), self.decode))
+
+    def iter_blocks(self) -> Result[Iterator[bytes], str]:
+        """Return an iterator of raw whole-line blocks from stdin.
+
+        Used by bulk scanners that search many lines per call; see
+        split_blocks. Nothing is decoded here - use decode() on the lines
+        that are actually needed.
+
+        Returns:
+            Ok(iterator of byte blocks) (stdin needs no opening, so never Err)
+
+        Raises:
+            IOError: While iterating, on read failure
+        """
+        return Ok(self._iter_blocks())
+
+    @property
+    def encoding(self) -> str:
+        """Encoding used to decode stdin content."""
+        return sys.stdin.encoding
+
+    def decode(self, raw: bytes) -> str:
+        """Decode one raw line the same way read_lines does."""
+        return raw.decode(sys.stdin.encoding, sys.stdin.errors or 'strict')
+
+    def _iter(self) -> Iterator[Line]:
+        """Yield decoded Lines from stdin until EOF or interruption."""
+        encoding = sys.stdin.encoding
+        errors = sys.stdin.errors or 'strict'
+        # read1 returns whatever is available, so streaming input
+        # (e.g. tail -f) is not held back waiting for a full chunk
+        raw_lines = split_lines(iter_chunks(_stdin_buffer().read1))
+
+        try:
+            for line_number, raw in enumerate(raw_lines, start=1):
+                yield Line(
+                    line_number,
+                    raw.decode(encoding, errors)
+                )
+        except BrokenPipeError:
+            # This is normal when piping to commands like head
+            # that close the pipe early - not an error
+            pass
+        except KeyboardInterrupt:
+            # User interrupted with Ctrl+C - not an error
+            pass
+
+    def _iter_blocks(self) -> Iterator[bytes]:
+        """Yield whole-line byte blocks from stdin until EOF or interruption."""
+        try:
+            yield from split_blocks(iter_chunks(_stdin_buffer().read1))
+        except BrokenPipeError:
+            # Same early-close handling as _iter
+            pass
         except KeyboardInterrupt:
             # User interrupted with Ctrl+C - not an error
             pass
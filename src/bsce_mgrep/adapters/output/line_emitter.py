@@ -5,22 +5,89 @@ Errors are written to stderr.
 """
 
 import sys
-from dataclasses import dataclass
-from typing import Iterator
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Callable, Iterator, TextIO
 from result import Result, Ok, Err
 
+from bsce_mgrep.domain.pipeline import count_results
 from bsce_mgrep.domain.types import MatchContext
 
+# Matched lines are written to stdout in batches of roughly this many characters
+WRITE_BATCH_SIZE = 64 << 10  # 64 KiB
+
+class _BatchedOutput:
+    """Collects output lines and writes them to a stream in large batches.
+
+    Replaces one print() per match (attribute lookups, argument formatting,
+    and a write per call) with one encoded write per batch. Interactive
+    streams are flushed after every line so terminal output stays live.
+    """
+    __slots__ = ('_stream', '_write', '_pending', '_size', '_limit')
+
+    def __init__(self, stream: TextIO):
+        # Anything already printed must come out before our batches
+        stream.flush()
+        self._stream = stream
+        self._write = _binary_writer(stream)
+        self._pending: list[str] = []
+        self._size = 0
+        self._limit = 0 if stream.isatty() else WRITE_BATCH_SIZE
+
+    def write_line(self, text: str) -> None:
+        """Queue one line (without newline), flushing when the batch is full."""
+        self._pending.append(text)
+        self._size += len(text) + 1
+
+        if self._size > self._limit:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all queued lines to the stream."""
+        if self._pending:
+            self._pending.append('')
+            self._write('\n'.join(self._pending))
+            self._pending.clear()
+            self._size = 0
+        self._stream.flush()
+
+def _binary_writer(stream: TextIO) -> Callable[[str], object]:
+    """Return a function writing text to the stream's binary buffer.
+
+    Text is encoded with the stream's own encoding and error handler, exactly
+    as print() would. Streams without a binary buffer (e.g. io.StringIO) get
+    their text write method.
+    """
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        return stream.write
+
+    write = buffer.write
+    encoding = stream.encoding
+    errors = stream.errors or 'strict'
+    return lambda text: write(text.encode(encoding, errors))
+
+# Output line formatters: plain content (a C-level attribute getter) or
+# "number:content"
+_line_content: Callable[[MatchContext], str] = attrgetter('line.content')
+
+def _numbered_line(context: MatchContext) -> str:
+    """Format a matched line as "number:content"."""
+    return f"{context.line.number}:{context.line.content}"
+
 @dataclass(frozen=True, slots=True)
 class LineEmitter:
     """Adapter for emitting matched lines to stdout.
-    
+
     Writes matching line content to stdout and errors to stderr.
     This is a pure output adapter at the boundary of the system.
-    
+
+    The output format is chosen once per emit call rather than per line,
+    so the per-line path carries no branch (see _formatter).
+
     Attributes:
         show_line_numbers: Whether to prefix output with line numbers
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "ERROR: timeout")
@@ -28,99 +95,151 @@ class LineEmitter:
         >>> emitter = LineEmitter()
         >>> emitter.emit(iter([Ok(ctx)]))
         ERROR: timeout
+        >>> LineEmitter(show_line_numbers=True).emit(iter([Ok(ctx)]))
+        1:ERROR: timeout
     """
     show_line_numbers: bool = False
-    
+
+    def _formatter(self) -> Callable[[MatchContext], str]:
+        """Return the function formatting one match as an output line."""
+        return _numbered_line if self.show_line_numbers else _line_content
+
     def emit(self, contexts: Iterator[Result[MatchContext, str]]) -> None:
         """Emit matched lines to stdout.
-        
+
         Successful matches are written to stdout. Errors are written to stderr.
         Each line is written as-is (original content).
-        
+
+        Matches are batched into large writes on sys.stdout.buffer; pending
+        matches are flushed before each error so relative order is kept.
+
         Args:
             contexts: Iterator of MatchContext Results to emit
-            
+
         Side Effects:
             Writes to sys.stdout (matches)
             Writes to sys.stderr (errors)
         """
-        for result in contexts:
-            match result:
-                case Ok(context):
-                    if self.show_line_numbers:
-                        print(f"{context.line.number}:{context.line.content}", file=sys.stdout)
-                    else:
-                        print(context.line.content, file=sys.stdout)
-                case Err(error):
-                    print(f"Error: {error}", file=sys.stderr)
-    
+        out = _BatchedOutput(sys.stdout)
+        write_line = out.write_line
+        format_line = self._formatter()
+
+        # Dispatch on the exact type: Ok and Err are final classes, and this
+        # avoids the match protocol for every emitted line
+        try:
+            for result in contexts:
+                if type(result) is Ok:
+                    write_line(format_line(result.ok_value))
+                elif type(result) is Err:
+                    out.flush()
+                    print(f"Error: {result.err_value}", file=sys.stderr)
+        finally:
+            # Matches read before a failure are still written
+            out.flush()
+
+    def emit_from(
+        self,
+        produce: Callable[[Callable[[MatchContext], object], Callable[[str], object]], None]
+    ) -> None:
+        """Emit matches pushed by a fused producer.
+
+        Push-style counterpart of emit(): `produce` is called once with an
+        `emit` callback for matches and a `report` callback for error
+        messages, so matches reach the output batch without a Result or a
+        generator hand-off in between.
+
+        Args:
+            produce: Function driving the whole scan, e.g. a bound line runner
+
+        Side Effects:
+            Writes to sys.stdout (matches)
+            Writes to sys.stderr (errors)
+        """
+        out = _BatchedOutput(sys.stdout)
+        write_line = out.write_line
+        format_line = self._formatter()
+
+        def report(error: str) -> None:
+            """Write an error, after the matches that precede it."""
+            out.flush()
+            print(f"Error: {error}", file=sys.stderr)
+
+        try:
+            produce(lambda context: write_line(format_line(context)), report)
+        finally:
+            out.flush()
+
     def emit_with_groups(self, contexts: Iterator[Result[MatchContext, str]]) -> None:
         """Emit matched lines with captured groups.
-        
+
         Shows both the line and any regex groups that were captured.
         Useful for debugging or when groups are important.
-        
+
         Args:
             contexts: Iterator of MatchContext Results to emit
-            
+
         Side Effects:
             Writes to sys.stdout (matches with groups)
             Writes to sys.stderr (errors)
         """
+        out = _BatchedOutput(sys.stdout)
+        write_line = out.write_line
+        format_line = self._formatter()
+
         for result in contexts:
-            match result:
-                case Ok(context):
-                    line_prefix = f"{context.line.number}:" if self.show_line_numbers else ""
-                    print(f"{line_prefix}{context.line.content}", file=sys.stdout)
-                    
-                    if context.groups:
-                        for name, value in context.groups.items():
-                            print(f"  {name}: {value}", file=sys.stdout)
-                case Err(error):
-                    print(f"Error: {error}", file=sys.stderr)
+            if type(result) is Ok:
+                context = result.ok_value
+                write_line(format_line(context))
 
+                if context.groups:
+                    for name, value in context.groups.items():
+                        write_line(f"  {name}: {value}")
+            elif type(result) is Err:
+                out.flush()
+                print(f"Error: {result.err_value}", file=sys.stderr)
 
-@dataclass(frozen=True, slots=True)
+        out.flush()
+
+
+@dataclass(slots=True)
 class CountingEmitter:
     """Emitter that counts matches instead of printing them.
-    
+
     Useful for implementing a --count flag (future feature).
-    
+
+    Attributes:
+        match_count: Number of matches seen by the last emit() call
+        error_count: Number of errors seen by the last emit() call
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "ERROR: timeout")
         >>> ctx = MatchContext(line=line, groups={})
         >>> emitter = CountingEmitter()
         >>> emitter.emit(iter([Ok(ctx)]))
+        Matches: 1
         >>> emitter.match_count
         1
     """
-    
-    def __post_init__(self):
-        """Initialize mutable counter.
-        
-        Note: This breaks immutability, but is isolated to I/O boundary.
-        For pure functional alternative, use count_results from pipeline.
-        """
-        object.__setattr__(self, 'match_count', 0)
-        object.__setattr__(self, 'error_count', 0)
-    
+    # Mutable (not frozen): the counters are this I/O adapter's only state.
+    # The counting itself is the pure count_results from pipeline.
+    match_count: int = field(default=0, init=False)
+    error_count: int = field(default=0, init=False)
+
     def emit(self, contexts: Iterator[Result[MatchContext, str]]) -> None:
         """Count matches and errors.
-        
+
+        Counting is delegated to count_results; the attributes are assigned
+        once, after the iterator is exhausted.
+
         Args:
             contexts: Iterator of MatchContext Results to count
-            
+
         Side Effects:
             Updates internal counters
         """
-        for result in contexts:
-            match result:
-                case Ok(_):
-                    object.__setattr__(self, 'match_count', self.match_count + 1)
-                case Err(_):
-                    object.__setattr__(self, 'error_count', self.error_count + 1)
-        
+        self.match_count, self.error_count = count_results(contexts)
+
         # Print counts
         print(f"Matches: {self.match_count}", file=sys.stdout)
         if self.error_count > 0:
@@ -1,25 +1,46 @@
-"""CLI argument parsing using argparse.
+"""CLI argument parsing.
 
 This module handles command-line argument parsing and validation.
 Returns immutable CLIArgs dataclass using Railway-Oriented Programming.
 """
 
-import argparse
 import sys
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
 from result import Result, Ok, Err
 
+if TYPE_CHECKING:
+    import argparse
+
+    from bsce_mgrep.domain.matcher import RegexEngine
+
+# Accepted values for --case
+CASE_MODES = ['sensitive', 'insensitive']
+
+# Accepted values for --engine
+ENGINES = ['re', 're2', 'hyperscan']
+
+# Options that take a value
+_VALUE_OPTIONS = frozenset({'--match', '--case', '--where', '--engine'})
+
+# Options that are plain on/off switches
+_LINE_NUMBER_FLAGS = frozenset({'-n', '--line-number'})
+
 
 @dataclass(frozen=True, slots=True)
 class CLIArgs:
     """Parsed CLI arguments.
-    
+
     Attributes:
         source: File path or None (for stdin)
         pattern: Pattern to match (literal or /regex/)
         case_sensitive: Whether matching is case-sensitive
         where_clauses: List of where clause expressions
-        
+        byte_mode: Whether lines may be matched as raw bytes and decoded
+            only when they match (see _determine_byte_mode)
+        show_line_numbers: Whether to prefix output with line numbers
+        engine: Regex engine ('re', 're2' or 'hyperscan')
+
     Examples:
         >>> args = CLIArgs(
         ...     source="app.log",
@@ -34,17 +55,35 @@ class CLIArgs:
     pattern: str
     case_sensitive: bool
     where_clauses: list[str]
+    byte_mode: bool = False
+    show_line_numbers: bool = False
+    engine: 'RegexEngine' = 're'
+
+
+class _RawArgs(NamedTuple):
+    """Command-line values before defaults and validation are applied."""
+    source: str | None
+    match: str
+    case: str | None
+    where_clauses: list[str]
+    line_number: bool = False
+    engine: str | None = None
 
 
 def parse_args(argv: list[str] | None = None) -> Result[CLIArgs, str]:
-    """Parse CLI arguments using argparse.
-    
+    """Parse CLI arguments.
+
+    Well-formed command lines are parsed by a small hand-rolled scanner, so
+    the common invocation never imports argparse. Anything else (--help,
+    errors, abbreviated options, option-like values) is handed to argparse,
+    which produces the usual help and error messages.
+
     Args:
         argv: Arguments to parse (defaults to sys.argv)
-        
+
     Returns:
         Result containing CLIArgs or error message
-        
+
     Examples:
         >>> result = parse_args(["test.log", "--match", "ERROR"])
         >>> isinstance(result, Ok)
@@ -52,6 +91,130 @@ def parse_args(argv: list[str] | None = None) -> Result[CLIArgs, str]:
         >>> result.ok_value.pattern
         'ERROR'
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    raw = _scan_args(argv)
+
+    if raw is None:
+        try:
+            namespace = _build_argparser().parse_args(argv)
+        except SystemExit as e:
+            # argparse calls sys.exit on error or --help
+            if e.code == 0:
+                # --help was requested
+                return Err("Help requested")
+            else:
+                return Err("Invalid arguments")
+
+        raw = _RawArgs(
+            source=namespace.source,
+            match=namespace.match,
+            case=namespace.case,
+            where_clauses=namespace.where_clauses,
+            line_number=namespace.line_number,
+            engine=namespace.engine
+        )
+
+    # Validate source input
+    if raw.source is None and not _is_stdin_piped():
+        return Err("No input source: provide a file path or pipe input via stdin")
+
+    # Determine case sensitivity
+    case_sensitive = _determine_case_sensitivity(
+        raw.match,
+        raw.case
+    )
+
+    return Ok(CLIArgs(
+        source=raw.source,
+        pattern=raw.match,
+        case_sensitive=case_sensitive,
+        where_clauses=raw.where_clauses,
+        byte_mode=_determine_byte_mode(raw.match, raw.where_clauses),
+        show_line_numbers=raw.line_number,
+        engine=_determine_engine(raw.engine)
+    ))
+
+
+def _scan_args(argv: list[str]) -> _RawArgs | None:
+    """Parse a well-formed command line without argparse.
+
+    Accepts exactly what argparse would accept for the common forms:
+    `--match X`, `--case MODE`, `--where EXPR`, `--engine NAME` (each also
+    as `--opt=value`), the `-n`/`--line-number` switch and one positional
+    source. Returns None for anything else, including values starting with
+    '-', so argparse can handle or report it.
+
+    Args:
+        argv: Arguments to parse (without the program name)
+
+    Returns:
+        The parsed values, or None if argparse must take over
+
+    Examples:
+        >>> raw = _scan_args(["app.log", "--match", "ERROR", "--where=line.length > 80"])
+        >>> raw.source, raw.match, raw.where_clauses
+        ('app.log', 'ERROR', ['line.length > 80'])
+        >>> _scan_args(["--help"]) is None
+        True
+        >>> _scan_args(["app.log", "--match"]) is None
+        True
+    """
+    source = None
+    match = None
+    case = None
+    where_clauses: list[str] = []
+    line_number = False
+    engine = None
+
+    args = iter(argv)
+
+    for arg in args:
+        if not arg.startswith('-'):
+            if source is not None:
+                return None
+            source = arg
+            continue
+
+        if arg in _LINE_NUMBER_FLAGS:
+            line_number = True
+            continue
+
+        option, has_value, value = arg.partition('=')
+
+        if option not in _VALUE_OPTIONS:
+            return None
+
+        if not has_value:
+            following = next(args, None)
+            # A missing or option-like value is reported by argparse
+            if following is None or following.startswith('-'):
+                return None
+            value = following
+
+        match option:
+            case '--match':
+                match = value
+            case '--case' if value in CASE_MODES:
+                case = value
+            case '--where':
+                where_clauses.append(value)
+            case '--engine' if value in ENGINES:
+                engine = value
+            case _:
+                return None
+
+    if match is None:
+        return None
+
+    return _RawArgs(source, match, case, where_clauses, line_number, engine)
+
+
+def _build_argparser() -> 'argparse.ArgumentParser':
+    """Build the full argparse parser (imported lazily, only when needed)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog='mgrep',
         description='Functional grep with semantic filtering',
@@ -61,30 +224,32 @@ Examples:
   mgrep app.log --match '/status=(?<code>\\d+)/' --where 'group("code") >= 500'
   cat app.log | mgrep --match 'ERROR'
   mgrep app.log --match 'error' --case insensitive
+  mgrep app.log --match 'ERROR' -n
         ''',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    
+
     parser.add_argument(
         'source',
         nargs='?',  # Optional positional argument
         help='Input file (omit to read from stdin if piped)'
     )
-    
+
     parser.add_argument(
         '--match',
         required=True,
         metavar='PATTERN',
         help='Pattern to match: literal string or /regex/ with optional named groups'
     )
-    
+
     parser.add_argument(
         '--case',
-        choices=['sensitive', 'insensitive'],
+        choices=CASE_MODES,
         metavar='MODE',
-        help='Case sensitivity: sensitive or insensitive (default: insensitive for literals, sensitive for regex)'
+        help='Case sensitivity: sensitive or insensitive '
+             '(default: insensitive for literals, sensitive for regex)'
     )
-    
+
     parser.add_argument(
         '--where',
         action='append',
@@ -93,51 +258,55 @@ Examples:
         metavar='EXPR',
         help='Semantic filter expression (can be specified multiple times for AND logic)'
     )
-    
-    try:
-        args = parser.parse_args(argv)
-        
-        # Validate source input
-        if args.source is None and not _is_stdin_piped():
-            return Err("No input source: provide a file path or pipe input via stdin")
-        
-        # Determine case sensitivity
-        case_sensitive = _determine_case_sensitivity(
-            args.match,
-            args.case
-        )
-        
-        return Ok(CLIArgs(
-            source=args.source,
-            pattern=args.match,
-            case_sensitive=case_sensitive,
-            where_clauses=args.where_clauses
-        ))
-    
-    except SystemExit as e:
-        # argparse calls sys.exit on error or --help
-        if e.code == 0:
-            # --help was requested
-            return Err("Help requested")
-        else:
-            return Err("Invalid arguments")
+
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        metavar='NAME',
+        help='Regex engine: re, re2 (linear time, needs google-re2) or hyperscan '
+             '(block prefilter, needs hyperscan; default: re)'
+    )
+
+    parser.add_argument(
+        '-n', '--line-number',
+        action='store_true',
+        help='Prefix each matched line with its line number'
+    )
+
+    return parser
+
+
+def _determine_engine(engine: str | None) -> 'RegexEngine':
+    """Narrow a validated --engine value to a RegexEngine ('re' if unset).
+
+    Examples:
+        >>> _determine_engine('re2')
+        're2'
+        >>> _determine_engine(None)
+        're'
+    """
+    match engine:
+        case 're2' | 'hyperscan':
+            return engine
+        case _:
+            return 're'
 
 
 def _determine_case_sensitivity(pattern: str, case_flag: str | None) -> bool:
     """Determine case sensitivity based on pattern type and explicit flag.
-    
+
     Logic:
     - If explicit flag provided → use it
     - Else if regex pattern → sensitive (default)
     - Else if literal pattern → insensitive (default)
-    
+
     Args:
         pattern: The match pattern
         case_flag: Explicit case flag ('sensitive' or 'insensitive' or None)
-        
+
     Returns:
         True for case-sensitive, False for case-insensitive
-        
+
     Examples:
         >>> _determine_case_sensitivity("ERROR", None)
         False
@@ -151,7 +320,7 @@ def _determine_case_sensitivity(pattern: str, case_flag: str | None) -> bool:
         return True
     if case_flag == 'insensitive':
         return False
-    
+
     # Auto-detect based on pattern type
     if _is_regex_pattern(pattern):
         # Regex default: case-sensitive
@@ -161,15 +330,40 @@ def _determine_case_sensitivity(pattern: str, case_flag: str | None) -> bool:
         return False
 
 
+def _determine_byte_mode(pattern: str, where_clauses: list[str]) -> bool:
+    """Determine whether lines can be kept as bytes until they match.
+
+    An ASCII pattern can be searched in raw bytes with the same result as in
+    decoded text for ASCII lines. Where clauses work on decoded line content,
+    so they require the text path.
+
+    Args:
+        pattern: The match pattern
+        where_clauses: Where clause expressions
+
+    Returns:
+        True if byte mode can be used
+
+    Examples:
+        >>> _determine_byte_mode("/ERROR|WARN/", [])
+        True
+        >>> _determine_byte_mode("ERROR", ["line.length > 80"])
+        False
+        >>> _determine_byte_mode("ÉRROR", [])
+        False
+    """
+    return pattern.isascii() and not where_clauses
+
+
 def _is_regex_pattern(pattern: str) -> bool:
     """Check if pattern is wrapped in /.../ delimiters.
-    
+
     Args:
         pattern: Pattern string to check
-        
+
     Returns:
         True if pattern has regex delimiters
-        
+
     Examples:
         >>> _is_regex_pattern("/test/")
         True
@@ -185,10 +379,10 @@ def _is_regex_pattern(pattern: str) -> bool:
 
 def _is_stdin_piped() -> bool:
     """Check if stdin is piped (not a TTY).
-    
+
     Returns:
         True if stdin is piped, False if interactive terminal
-        
+
     Examples:
         >>> # In terminal: _is_stdin_piped() → False
         >>> # In pipe (cat file | prog): _is_stdin_piped() → True
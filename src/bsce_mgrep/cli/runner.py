@@ -4,35 +4,75 @@ This module wires together all components and executes the mgrep pipeline.
 Uses dependency injection via the hexagonal architecture.
 """
 
+import codecs
+import os
+import re
 import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING
 from result import Result, Ok, Err
 
 from bsce_mgrep.cli.parser import _is_stdin_piped
 from bsce_mgrep.cli.parser import CLIArgs
 from bsce_mgrep.adapters.input.file_reader import FileReader
+from bsce_mgrep.adapters.input.line_splitter import check_blocks
 from bsce_mgrep.adapters.input.stdin_reader import StdinReader
 from bsce_mgrep.adapters.output.line_emitter import LineEmitter
-from bsce_mgrep.domain.matcher import create_matcher, MatchConfig
-from bsce_mgrep.domain.filter import create_filter
-from bsce_mgrep.domain.pipeline import build_pipeline
+from bsce_mgrep.domain.matcher import (
+    create_batch_matcher, create_line_matcher, pattern_options, MatchConfig
+)
+from bsce_mgrep.domain.byte_scan import compile_byte_regex, scan_regex_blocks
+from bsce_mgrep.domain.filter import create_predicate
+from bsce_mgrep.domain.hyperscan_scan import compile_hyperscan, scan_candidate_lines
+from bsce_mgrep.domain.literal_scan import can_scan_literal, scan_literal
+from bsce_mgrep.domain.pipeline import build_batch_runner, build_line_runner, Emit, Report
+from bsce_mgrep.domain.types import (
+    Line, LineBatch, LineResult, MatchContext, MatchResult, NO_GROUPS
+)
 from bsce_mgrep.ports.reader import SourceReader
 
+if TYPE_CHECKING:
+    import hyperscan
+
+# Files at least this large are split into shards scanned in parallel
+PARALLEL_THRESHOLD = 64 << 20  # 64 MiB
+
+# Approximate size of one shard; a shard's matches are held in memory
+# until they are emitted
+SHARD_SIZE = 16 << 20  # 16 MiB
+
+# A matching stage: runs the whole scan, pushing matches and error messages
+type Stage = Callable[[Emit, Report], None]
+
+# A fused match + filter loop over lines (see build_line_runner)
+type LineRunner = Callable[[Iterator[Line], Emit, Report], None]
+
+# The same loop over batches of lines (see build_batch_runner)
+type BatchRunner = Callable[[Iterator[LineBatch], Emit, Report], None]
+
 def run(args: CLIArgs) -> Result[None, str]:
     """Execute the mgrep pipeline.
-    
+
     Orchestration steps:
     1. Select appropriate reader (file or stdin)
-    2. Create matcher from pattern
-    3. Create filter from where clauses
-    4. Build and execute pipeline
-    5. Emit results to stdout
-    
+    2. Build the matching stage: large files are sharded across processes;
+       otherwise a bulk literal scan for plain literals without where
+       clauses, or the matcher + filter pipeline
+    3. Execute it, pushing matches straight into the emitter (in input order)
+
+    The hot loop runs unboxed and fused (bare Lines, None on no match, bool
+    filters, matches handed directly to the output); errors are converted to
+    Err here, at the outermost boundary.
+
     Args:
         args: Parsed CLI arguments
-        
+
     Returns:
         Ok(None) on success, Err(message) on failure
-        
+
     Examples:
         >>> from bsce_mgrep.cli.parser import CLIArgs
         >>> args = CLIArgs(
@@ -45,66 +85,446 @@ def run(args: CLIArgs) -> Result[None, str]:
     """
     # Step 1: Select reader based on source
     reader_result = _select_reader(args.source)
-    
+
     match reader_result:
         case Err(error):
             return Err(error)
         case Ok(reader):
             pass
-    
-    # Step 2: Create matcher
-    matcher = create_matcher(MatchConfig(
-        pattern=args.pattern,
-        case_sensitive=args.case_sensitive
-    ))
-    
-    # Step 3: Create filter
-    filter_fn = create_filter(args.where_clauses)
-    
-    # Step 4: Build pipeline
-    pipeline = build_pipeline(matcher, filter_fn)
-    
-    # Step 5: Execute pipeline
+
+    # Step 2: Build the matching stage
+    if isinstance(reader, FileReader) and (shard_count := _shard_count(reader)) > 1:
+        stage_result = _parallel_run(reader, args, shard_count)
+    else:
+        stage_result = _match_run(reader, args)
+
+    # Step 3: Execute, pushing matches straight into the emitter
     try:
-        lines = reader.read_lines()
-        contexts = pipeline(lines)
-        
-        # Step 6: Emit results
-        emitter = LineEmitter(show_line_numbers=False)
-        emitter.emit(contexts)
-        
+        match stage_result:
+            case Err(error):
+                return Err(error)
+            case Ok(stage):
+                pass
+
+        emitter = LineEmitter(show_line_numbers=args.show_line_numbers)
+        emitter.emit_from(stage)
+
         return Ok(None)
-    
+
     except BrokenPipeError:
         # Normal when piping to head, etc.
         # Python writes to stdout, but the reader closed the pipe
-        # This is not an error - just cleanup and exit
-        devnull = open('/dev/null', 'w')
-        sys.stdout = devnull
+        # This is not an error - point fd 1 at /dev/null so the final
+        # flush at interpreter exit cannot fail again, and exit cleanly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
         return Ok(None)
-    
+
     except KeyboardInterrupt:
         # User interrupted with Ctrl+C
         return Err("Interrupted by user")
-    
+
+    except UnicodeDecodeError as e:
+        # Raised by the reader while iterating
+        return Err(f"Encoding error: {e}")
+
+    except OSError as e:
+        # Raised by the reader while iterating
+        return Err(f"Read error: {e}")
+
     except Exception as e:
         # Unexpected error
         return Err(f"Unexpected error: {e}")
 
+def _match_run(reader: SourceReader, args: CLIArgs) -> Result[Stage, str]:
+    """Build the single-process matching stage best suited to the arguments."""
+    if _is_plain_literal(args, reader):
+        return _fast_literal_run(reader, args.pattern, args.case_sensitive)
+
+    if args.engine == 'hyperscan' and _is_utf8(reader):
+        config = MatchConfig(pattern=args.pattern, case_sensitive=args.case_sensitive)
+        try:
+            database = compile_hyperscan(config)
+        except ValueError:
+            # Hyperscan missing or pattern unsupported - use re alone
+            pass
+        else:
+            return _hyperscan_run(reader, database, args)
+
+    # Byte regexes are compiled with re, so RE2 always matches decoded text
+    if args.byte_mode and args.engine == 're' and _is_utf8(reader):
+        config = MatchConfig(pattern=args.pattern, case_sensitive=args.case_sensitive)
+        try:
+            regex = compile_byte_regex(config)
+        except ValueError:
+            # Not expressible as a bytes regex - match decoded text instead
+            pass
+        else:
+            return _byte_regex_run(reader, regex, config)
+
+    return _pipeline_run(reader, args)
+
+def _shard_count(reader: FileReader) -> int:
+    """Return how many shards the file should be scanned in (1 = no sharding).
+
+    Only whole regular files of at least PARALLEL_THRESHOLD bytes are
+    sharded, in shards of about SHARD_SIZE bytes, and only on machines
+    with more than one CPU.
+    """
+    if reader.start or reader.end is not None or (os.cpu_count() or 1) < 2:
+        return 1
+
+    try:
+        size = os.path.getsize(reader.filepath)
+    except OSError:
+        # Let the reader report the error
+        return 1
+
+    return -(-size // SHARD_SIZE) if size >= PARALLEL_THRESHOLD else 1
+
+def _parallel_run(reader: FileReader, args: CLIArgs, shard_count: int) -> Result[Stage, str]:
+    """Scan line-aligned shards of a large file in worker processes.
+
+    Each worker runs the regular single-process matching stage on its byte
+    range. Results are merged in shard order and line numbers are rebased
+    using the line counts of the preceding shards, so output is identical
+    to a sequential run.
+
+    Shards are submitted as earlier ones are emitted, at most two per
+    worker at a time, so the matches waiting in memory are bounded by a
+    few shards' worth whatever the file size.
+
+    Args:
+        reader: Reader for a whole file
+        args: Parsed CLI arguments (sent to the workers)
+        shard_count: Number of shards
+
+    Returns:
+        Ok(stage pushing matches in input order) or Err(message)
+    """
+    try:
+        ranges = reader.shard_ranges(shard_count)
+    except OSError:
+        # Let the reader report the error
+        ranges = []
+
+    if len(ranges) < 2:
+        return _match_run(reader, args)
+
+    # Imported here: multiprocessing costs startup time on every other run
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    filepath = reader.filepath
+    workers = min(os.cpu_count() or 1, len(ranges))
+
+    def merged(emit: Emit, report: Report) -> None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = iter(ranges)
+            # Submitted shards, oldest first
+            in_flight: deque[Future[Result[tuple[list[MatchResult], int], str]]] = deque(
+                pool.submit(_run_shard, filepath, args, start, end)
+                for start, end in islice(pending, 2 * workers)
+            )
+            # Lines in the shards already emitted
+            base = 0
+
+            try:
+                while in_flight:
+                    outcome = in_flight.popleft().result()
+
+                    # Keep the workers busy while this shard is emitted
+                    for start, end in islice(pending, 1):
+                        in_flight.append(pool.submit(_run_shard, filepath, args, start, end))
+
+                    match outcome:
+                        case Err(error):
+                            report(error)
+                            return
+                        case Ok((results, line_count)):
+                            pass
+
+                    for result in results:
+                        match result:
+                            case Ok(context) if base:
+                                line = context.line
+                                emit(MatchContext(
+                                    line=Line(line.number + base, line.content),
+                                    groups=context.groups
+                                ))
+                            case Ok(context):
+                                emit(context)
+                            case Err(error):
+                                report(error)
+
+                    base += line_count
+            finally:
+                pool.shutdown(cancel_futures=True)
+
+    return Ok(merged)
+
+def _run_shard(
+    filepath: str, args: CLIArgs, start: int, end: int
+) -> Result[tuple[list[MatchResult], int], str]:
+    """Worker entry point: match one byte range of a file.
+
+    Returns:
+        Ok((results with shard-relative line numbers, line count)) or Err
+    """
+    reader = _LineCountingReader(FileReader(filepath=filepath, start=start, end=end))
+    results: list[MatchResult] = []
+
+    match _match_run(reader, args):
+        case Err(error):
+            return Err(error)
+        case Ok(stage):
+            # Results are pickled back to the parent, and the shared
+            # read-only NO_GROUPS mapping cannot be pickled: send plain dicts
+            stage(
+                lambda context: results.append(Ok(context._replace(groups=dict(context.groups)))),
+                lambda error: results.append(Err(error))
+            )
+
+    return Ok((results, reader.line_count))
+
+class _LineCountingReader:
+    """SourceReader wrapper counting the lines read through it.
+
+    Lets a shard worker learn its line count from the matching pass itself
+    rather than reading its byte range a second time. Every matching stage
+    consumes its whole input, so after the stage has run, line_count holds
+    the number of newlines in the shard (shards end on a line boundary).
+    """
+    __slots__ = ('_reader', 'line_count')
+
+    def __init__(self, reader: SourceReader):
+        self._reader = reader
+        self.line_count = 0
+
+    def read_lines(self) -> Iterator[LineResult]:
+        """Read Results from the wrapped reader, counting the lines."""
+        for result in self._reader.read_lines():
+            if type(result) is Ok:
+                self.line_count += 1
+            yield result
+
+    def iter_lines(self) -> Result[Iterator[Line], str]:
+        """Return the wrapped reader's Lines, counting them."""
+        return self._reader.iter_lines().map(self._count_lines)
+
+    def iter_line_batches(self) -> Result[Iterator[LineBatch], str]:
+        """Return the wrapped reader's LineBatches, counting their lines."""
+        return self._reader.iter_line_batches().map(self._count_batches)
+
+    def iter_blocks(self) -> Result[Iterator[bytes], str]:
+        """Return the wrapped reader's raw blocks, counting their newlines."""
+        return self._reader.iter_blocks().map(self._count_blocks)
+
+    @property
+    def encoding(self) -> str:
+        """Encoding of the wrapped reader."""
+        return self._reader.encoding
+
+    def decode(self, raw: bytes) -> str:
+        """Decode one raw line as the wrapped reader does."""
+        return self._reader.decode(raw)
+
+    def _count_lines(self, lines: Iterator[Line]) -> Iterator[Line]:
+        for self.line_count, line in enumerate(lines, start=1):
+            yield line
+
+    def _count_batches(self, batches: Iterator[LineBatch]) -> Iterator[LineBatch]:
+        for batch in batches:
+            self.line_count += len(batch.contents)
+            yield batch
+
+    def _count_blocks(self, blocks: Iterator[bytes]) -> Iterator[bytes]:
+        for block in blocks:
+            self.line_count += block.count(b'\n')
+            yield block
+
+def _is_plain_literal(args: CLIArgs, reader: SourceReader) -> bool:
+    """Check whether the invocation can use the bulk literal scan.
+
+    Requires a literal (non-regex) pattern, no where clauses, and UTF-8
+    input so that the needle can be searched in the raw bytes.
+    """
+    return (
+        not args.where_clauses
+        and not pattern_options(args.pattern, args.case_sensitive).is_regex
+        and can_scan_literal(args.pattern, args.case_sensitive)
+        and _is_utf8(reader)
+    )
+
+def _is_utf8(reader: SourceReader) -> bool:
+    """Check whether the reader decodes its input as UTF-8."""
+    return codecs.lookup(reader.encoding).name == 'utf-8'
+
+def _fast_literal_run(
+    reader: SourceReader, needle: str, case_sensitive: bool
+) -> Result[Stage, str]:
+    """Match a plain literal by scanning raw blocks of input.
+
+    Only the matching lines are decoded; everything else stays inside
+    C-level bytes searches. Output is identical to the pipeline's.
+
+    Args:
+        reader: Source reader (must decode as UTF-8)
+        needle: Literal pattern accepted by can_scan_literal
+        case_sensitive: Whether matching should be case-sensitive
+
+    Returns:
+        Ok(stage) or Err(message) if the source cannot be opened
+    """
+    decode = reader.decode
+
+    def stage(blocks: Iterator[bytes]) -> Stage:
+        def scan(emit: Emit, report: Report) -> None:
+            for line_number, raw in scan_literal(blocks, needle, case_sensitive, decode):
+                emit(MatchContext(line=Line(line_number, decode(raw)), groups=NO_GROUPS))
+        return scan
+
+    return _checked_blocks(reader).map(stage)
+
+def _byte_regex_run(
+    reader: SourceReader,
+    regex: re.Pattern[bytes],
+    config: MatchConfig
+) -> Result[Stage, str]:
+    """Match a regex against raw lines, decoding only what is needed.
+
+    Args:
+        reader: Source reader (must decode as UTF-8)
+        regex: Bytes-compiled pattern from compile_byte_regex(config)
+        config: Match configuration
+
+    Returns:
+        Ok(stage) or Err(message) if the source cannot be opened
+    """
+    decode = reader.decode
+
+    def stage(blocks: Iterator[bytes]) -> Stage:
+        def scan(emit: Emit, report: Report) -> None:
+            for context in scan_regex_blocks(blocks, regex, config, decode):
+                emit(context)
+        return scan
+
+    return _checked_blocks(reader).map(stage)
+
+def _checked_blocks(reader: SourceReader) -> Result[Iterator[bytes], str]:
+    """Return the reader's raw blocks for a scanner that decodes only matches.
+
+    The blocks are checked to decode (see check_blocks), so an undecodable
+    line raises its encoding error even if it does not match, as it would
+    when every line is decoded.
+    """
+    decode = reader.decode
+    return reader.iter_blocks().map(lambda blocks: check_blocks(blocks, decode))
+
+def _pipeline_run(reader: SourceReader, args: CLIArgs) -> Result[Stage, str]:
+    """Build the fused matcher + filter loop over the reader's lines.
+
+    UTF-8 sources are read as LineBatches and matched a batch at a time.
+    Batches follow the reader's blocks (one read of stdin each), so
+    streaming input (e.g. tail -f) is never held back to fill a batch.
+    Other encodings are decoded and matched line by line.
+
+    Args:
+        reader: Source reader
+        args: Parsed CLI arguments
+
+    Returns:
+        Ok(stage) or Err(message) for filter or source errors
+    """
+    if _is_utf8(reader):
+        return _batch_runner(args).and_then(
+            lambda run_batches: reader.iter_line_batches().map(
+                lambda batches: partial(run_batches, batches)
+            )
+        )
+
+    return _line_runner(args).and_then(
+        lambda run_lines: reader.iter_lines().map(lambda lines: partial(run_lines, lines))
+    )
+
+def _hyperscan_run(
+    reader: SourceReader, database: 'hyperscan.Database', args: CLIArgs
+) -> Result[Stage, str]:
+    """Run the fused matcher + filter loop on Hyperscan's candidate lines.
+
+    Candidates are mostly true matches, so they are matched line by line:
+    a batch scan would have nothing to skip.
+
+    Args:
+        reader: Source reader (must decode as UTF-8)
+        database: Result of compile_hyperscan for the arguments' pattern
+        args: Parsed CLI arguments
+
+    Returns:
+        Ok(stage) or Err(message) for filter or source errors
+    """
+    decode = reader.decode
+
+    def stage(run_lines: LineRunner) -> Result[Stage, str]:
+        return _checked_blocks(reader).map(
+            lambda blocks: partial(run_lines, scan_candidate_lines(blocks, database, decode))
+        )
+
+    return _line_runner(args).and_then(stage)
+
+def _line_runner(args: CLIArgs) -> Result[LineRunner, str]:
+    """Build the fused line-by-line matcher + filter loop for the arguments.
+
+    Returns:
+        Ok(run(lines, emit, report)) or Err(message) for filter errors
+    """
+    return _predicate(args).map(
+        lambda predicate: build_line_runner(create_line_matcher(_match_config(args)), predicate)
+    )
+
+def _batch_runner(args: CLIArgs) -> Result[BatchRunner, str]:
+    """Build the fused batched matcher + filter loop for the arguments.
+
+    Returns:
+        Ok(run(batches, emit, report)) or Err(message) for filter errors
+    """
+    return _predicate(args).map(
+        lambda predicate: build_batch_runner(create_batch_matcher(_match_config(args)), predicate)
+    )
+
+def _match_config(args: CLIArgs) -> MatchConfig:
+    """Return the match configuration for the arguments."""
+    return MatchConfig(
+        pattern=args.pattern,
+        case_sensitive=args.case_sensitive,
+        engine=args.engine
+    )
+
+def _predicate(args: CLIArgs) -> Result[Callable[[MatchContext], bool] | None, str]:
+    """Build the where-clause predicate (None without where clauses).
+
+    Build errors are reported once, up front, as Err.
+    """
+    match create_predicate(args.where_clauses):
+        case Err(error):
+            return Err(error)
+        case Ok(predicate):
+            return Ok(predicate if args.where_clauses else None)
+
 def _select_reader(source: str | None) -> Result[SourceReader, str]:
     """Select appropriate reader based on source.
-    
+
     Logic:
     - If source is None and stdin is piped → StdinReader
     - If source is None and stdin is not piped → Error
     - If source is a filepath → FileReader
-    
+
     Args:
         source: File path or None
-        
+
     Returns:
         Result containing a SourceReader or error message
-        
+
     Examples:
         >>> result = _select_reader("test.log")
         >>> isinstance(result.ok_value, FileReader)
@@ -113,28 +533,28 @@ def _select_reader(source: str | None) -> Result[SourceReader, str]:
     match source:
         case None if _is_stdin_piped():
             return Ok(StdinReader())
-        
+
         case None:
             return Err("No input source: provide a file path or pipe input via stdin")
-        
+
         case str(filepath) if filepath.strip():
             return Ok(FileReader(filepath=filepath))
-        
+
         case _:
             return Err(f"Invalid source: {source}")
 
 def run_with_stats(args: CLIArgs) -> Result[tuple[int, int], str]:
     """Execute pipeline and return statistics.
-    
+
     Like run(), but returns match and error counts instead of emitting.
     Useful for testing and batch processing.
-    
+
     Args:
         args: Parsed CLI arguments
-        
+
     Returns:
         Ok((match_count, error_count)) or Err(message)
-        
+
     Examples:
         >>> from bsce_mgrep.cli.parser import CLIArgs
         >>> args = CLIArgs(
@@ -147,37 +567,48 @@ def run_with_stats(args: CLIArgs) -> Result[tuple[int, int], str]:
         >>> # match_count, error_count = result.ok_value
     """
     reader_result = _select_reader(args.source)
-    
+
     match reader_result:
         case Err(error):
             return Err(error)
         case Ok(reader):
             pass
-    
-    matcher = create_matcher(MatchConfig(
-        pattern=args.pattern,
-        case_sensitive=args.case_sensitive
-    ))
-    
-    filter_fn = create_filter(args.where_clauses)
-    pipeline = build_pipeline(matcher, filter_fn)
-    
+
+    # Where clause errors abort before any input is read
+    match create_predicate(args.where_clauses):
+        case Err(error):
+            return Err(error)
+        case Ok(_):
+            pass
+
+    # Same matching stage as run(): no Result is allocated per input line
+    match _match_run(reader, args):
+        case Err(_):
+            # Source errors count as one error, as read_lines reports them
+            return Ok((0, 1))
+        case Ok(stage):
+            pass
+
+    # Count instead of emit
+    match_count = 0
+    error_count = 0
+
+    def count_match(context: MatchContext) -> None:
+        nonlocal match_count
+        match_count += 1
+
+    def count_error(error: str) -> None:
+        nonlocal error_count
+        error_count += 1
+
     try:
-        lines = reader.read_lines()
-        contexts = pipeline(lines)
-        
-        # Count instead of emit
-        match_count = 0
-        error_count = 0
-        
-        for result in contexts:
-            match result:
-                case Ok(_):
-                    match_count += 1
-                case Err(_):
-                    error_count += 1
-        
-        return Ok((match_count, error_count))
-    
+        stage(count_match, count_error)
+
+    except (OSError, UnicodeDecodeError):
+        # A read error ends the input and counts once, as in read_lines
+        error_count += 1
+
     except Exception as e:
         return Err(f"Unexpected error: {e}")
+
+    return Ok((match_count, error_count))
@@ -0,0 +1,241 @@
+"""Regex matching over raw byte lines.
+
+This module implements byte mode for regex patterns. ASCII lines (the vast
+majority of typical logs) are searched as bytes with a bytes-compiled copy of
+the pattern and decoded only when they match. Lines containing non-ASCII bytes
+take the regular text matcher, so results are the same as matching decoded
+text line by line.
+
+Where possible, whole ASCII blocks are searched with a single call instead of
+being split into lines first (see scan_regex_blocks).
+"""
+
+import re
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from bsce_mgrep.domain.matcher import (
+    _JOINED_SEARCH_UNSAFE,
+    _LOOKAROUND,
+    MatchConfig,
+    _batch_prefilter_literal,
+    _compile,
+    create_batch_matcher,
+    create_line_matcher,
+    pattern_options,
+)
+from bsce_mgrep.domain.types import NO_GROUPS, Line, LineBatch, MatchContext
+
+# ASCII information separators: str regexes count them as whitespace (\s),
+# bytes regexes do not
+_INFO_SEPARATORS = re.compile(rb'[\x1c-\x1f]')
+
+# The same separators, each searchable with a fast bytes containment test
+_SEPARATOR_BYTES = (b'\x1c', b'\x1d', b'\x1e', b'\x1f')
+
+def compile_byte_regex(config: MatchConfig) -> re.Pattern[bytes]:
+    """Compile a /regex/ pattern for searching ASCII byte lines.
+
+    On ASCII input a bytes pattern behaves exactly like the str pattern:
+    classes such as \\w or \\d and IGNORECASE only differ on non-ASCII text.
+
+    Args:
+        config: Match configuration with an ASCII regex pattern
+
+    Returns:
+        The bytes-compiled pattern
+
+    Raises:
+        ValueError: If the pattern is not an ASCII regex, or it does not
+            compile as str or as bytes (e.g. it uses \\u escapes)
+
+    Examples:
+        >>> config = MatchConfig(pattern="/status=(?P<code>5\\\\d+)/", case_sensitive=True)
+        >>> compile_byte_regex(config).pattern
+        b'status=(?P<code>5\\\\d+)'
+    """
+    options = pattern_options(config.pattern, config.case_sensitive)
+
+    if not (options.is_regex and config.pattern.isascii()):
+        raise ValueError(f"Not an ASCII regex pattern: {config.pattern!r}")
+
+    try:
+        # The text pattern must be valid too, or the text path reports it
+        _compile(options.source, options.flags)
+        return _compile(options.source.encode('ascii'), options.flags)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}") from e
+
+def scan_regex_lines(
+    raw_lines: Iterator[bytes],
+    regex: re.Pattern[bytes],
+    config: MatchConfig,
+    decode: Callable[[bytes], str] = bytes.decode,
+    start: int = 1
+) -> Iterator[MatchContext]:
+    """Match raw lines, decoding only matches and non-ASCII lines.
+
+    If the pattern uses \\s or \\S, ASCII lines containing an information
+    separator (\\x1c-\\x1f) also take the text matcher, where \\s matches them.
+
+    Args:
+        raw_lines: Raw line content without newlines, in input order
+        regex: Result of compile_byte_regex(config)
+        config: Match configuration (used for non-ASCII lines)
+        decode: Decoder for non-ASCII lines (UTF-8 by default)
+        start: Number of the first line
+
+    Yields:
+        MatchContext for each matching line, numbered from `start`
+
+    Examples:
+        >>> config = MatchConfig(pattern="/code=(?P<code>\\\\d+)/", case_sensitive=True)
+        >>> regex = compile_byte_regex(config)
+        >>> [ctx.groups for ctx in scan_regex_lines(iter([b"code=500", b"ok"]), regex, config)]
+        [{'code': '500'}]
+    """
+    search = regex.search
+    has_groups = bool(regex.groupindex)
+    match_text = create_line_matcher(config)
+    separator = _INFO_SEPARATORS.search if _uses_whitespace_class(regex) else None
+
+    for line_number, raw in enumerate(raw_lines, start=start):
+        if raw.isascii() and (separator is None or not separator(raw)):
+            if match := search(raw):
+                groups = _decode_groups(match) if has_groups else NO_GROUPS
+                yield MatchContext(line=Line(line_number, raw.decode('ascii')), groups=groups)
+        elif (context := match_text(Line(line_number, decode(raw)))) is not None:
+            yield context
+
+def scan_regex_blocks(
+    blocks: Iterator[bytes],
+    regex: re.Pattern[bytes],
+    config: MatchConfig,
+    decode: Callable[[bytes], str] = bytes.decode
+) -> Iterator[MatchContext]:
+    """Match whole-line blocks (see split_blocks) without splitting them.
+
+    Blocks whose bytes all behave like text (ASCII, no carriage return, no
+    information separator if the pattern uses \\s or \\S) are searched
+    as they are with one MULTILINE copy of the regex, as the text batch
+    matcher does with a joined batch: only lines with a hit are cut out
+    and decoded, and hits that may differ from the line's own match are
+    re-checked on the line. Other blocks are decoded at once and go to the
+    text batch matcher, as do all blocks if that matcher prefilters on a
+    required literal (see _batch_prefilter_literal). Patterns whose meaning
+    depends on the whole string (see _JOINED_SEARCH_UNSAFE) go through
+    scan_regex_lines instead.
+
+    Args:
+        blocks: Iterator of byte blocks made of whole lines
+        regex: Result of compile_byte_regex(config)
+        config: Match configuration (used for non-ASCII blocks)
+        decode: Decoder for non-ASCII blocks (UTF-8 by default)
+
+    Yields:
+        MatchContext for each matching line, numbered from 1
+
+    Examples:
+        >>> config = MatchConfig(pattern="/^code=(?P<code>\\\\d+)/", case_sensitive=True)
+        >>> regex = compile_byte_regex(config)
+        >>> contexts = scan_regex_blocks(iter([b"ok\\ncode=500\\n"]), regex, config)
+        >>> [(ctx.line.number, ctx.groups) for ctx in contexts]
+        [(2, {'code': '500'})]
+    """
+    source = regex.pattern.decode('ascii')
+    if _JOINED_SEARCH_UNSAFE.search(source):
+        lines = (line for block in blocks for line in _block_lines(block))
+        yield from scan_regex_lines(lines, regex, config, decode)
+        return
+
+    joined_search = _compile(regex.pattern, regex.flags | re.MULTILINE).search
+    search = regex.search
+    exact_in_line = not _LOOKAROUND.search(source)
+    has_groups = bool(regex.groupindex)
+    match_batch = create_batch_matcher(config)
+    separators = _SEPARATOR_BYTES if _uses_whitespace_class(regex) else ()
+    search_bytes = not _batch_prefilter_literal(source, regex.flags)
+
+    # Number of lines in the blocks before the current one
+    line_count = 0
+
+    for block in blocks:
+        if (
+            not (search_bytes and block.isascii())
+            or b'\r' in block
+            or any(byte in block for byte in separators)
+        ):
+            try:
+                contents = decode(block).split('\n')
+            except UnicodeDecodeError:
+                # Line by line, matches before the offending line come first
+                raw_lines = _block_lines(block)
+                yield from scan_regex_lines(iter(raw_lines), regex, config, decode, line_count + 1)
+                line_count += len(raw_lines)
+                continue
+
+            if block.endswith(b'\n'):
+                contents.pop()
+            if b'\r' in block:
+                contents = [line[:-1] if line.endswith('\r') else line for line in contents]
+
+            numbers = range(line_count + 1, line_count + 1 + len(contents))
+            yield from match_batch(LineBatch(numbers, contents))
+            line_count += len(contents)
+            continue
+
+        find = block.find
+        rfind = block.rfind
+        count = block.count
+        # The newline ending the last line is not searched, like the
+        # newline-joined batches of the text matcher
+        end = len(block) - block.endswith(b'\n')
+        # Search position (always a line start) and index of its line
+        position = 0
+        index = 0
+
+        while (match := joined_search(block, position, end)) is not None:
+            start = match.start()
+            line_start = rfind(b'\n', position, start) + 1 or position
+            index += count(b'\n', position, line_start)
+            line_end = find(b'\n', start, end)
+            if line_end < 0:
+                line_end = end
+
+            raw = block[line_start:line_end]
+            if not (exact_in_line and match.end() <= line_end):
+                match = search(raw)
+            if match is not None:
+                groups = _decode_groups(match) if has_groups else NO_GROUPS
+                line = Line(line_count + index + 1, raw.decode('ascii'))
+                yield MatchContext(line=line, groups=groups)
+
+            position = line_end + 1
+            if position > end:
+                break
+            index += 1
+
+        line_count += count(b'\n') + (not block.endswith(b'\n'))
+
+def _block_lines(block: bytes) -> list[bytes]:
+    """Split a whole-line block into lines, as split_lines would."""
+    lines = block.split(b'\n')
+    if block.endswith(b'\n'):
+        lines.pop()
+    if b'\r' in block:
+        lines = [line[:-1] if line.endswith(b'\r') else line for line in lines]
+    return lines
+
+def _uses_whitespace_class(regex: re.Pattern[bytes]) -> bool:
+    """Check whether a pattern may see information separators as whitespace."""
+    return b'\\s' in regex.pattern or b'\\S' in regex.pattern
+
+def _decode_groups(match: re.Match[bytes]) -> dict[str, str | Any]:
+    """Decode the named groups of a match on an ASCII line.
+
+    Unmatched groups stay None, as in match.groupdict() on a text match.
+    """
+    return {
+        name: value if value is None else value.decode('ascii')
+        for name, value in match.groupdict().items()
+    }
@@ -4,83 +4,142 @@ This module composes multiple filter expressions into a single predicate functio
 using Railway-Oriented Programming.
 """
 
+from functools import lru_cache
 from typing import Callable
-from result import Ok, Err
+from result import Result, Ok, Err
 
-from bsce_mgrep.domain.types import MatchContext, FilterResult, FilterExpression
-from bsce_mgrep.domain.where_parser import parse_where_expression, evaluate_where, ASTNode
+from bsce_mgrep.domain.types import (
+    MatchContext, FilterResult, FilterExpression, FILTER_PASS, FILTER_REJECT
+)
+from bsce_mgrep.domain.where_parser import parse_where_expression, compile_predicate, ASTNode
+from bsce_mgrep.utils.config import CACHE_SIZE
 
-def create_filter(expressions: list[FilterExpression]) -> Callable[[MatchContext], FilterResult]:
+def no_filter(context: MatchContext) -> FilterResult:
+    """Pass-through filter that accepts every match.
+
+    A single shared function rather than a fresh lambda per call site, so
+    pipeline builders can recognize it by identity and drop the filter
+    stage altogether (see build_pipeline).
+
+    Examples:
+        >>> from bsce_mgrep.domain.types import Line
+        >>> no_filter(MatchContext(line=Line(1, "INFO: ok"), groups={})).ok_value
+        True
+    """
+    return FILTER_PASS
+
+def create_filter(
+    expressions: list[FilterExpression]
+) -> Result[Callable[[MatchContext], FilterResult], str]:
     """Create a composite filter from multiple where expressions.
-    
+
     Multiple expressions are combined with AND logic. If no expressions are
     provided, returns a filter that always passes.
-    
+
+    All expressions are parsed once and compiled into a single fused Python
+    predicate, so each line costs one function call instead of one AST walk
+    per expression.
+
     Args:
         expressions: List of where clause strings
-        
+
     Returns:
-        A pure function that evaluates all filters
-        
+        Ok(filter) with a pure function that evaluates all filters, or
+        Err(message) if any expression fails to build - callers can abort
+        before reading any input
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "ERROR: Database timeout")
         >>> ctx = MatchContext(line=line, groups={})
-        >>> filter_fn = create_filter(["line.length > 10"])
+        >>> filter_fn = create_filter(["line.length > 10"]).ok_value
         >>> result = filter_fn(ctx)
         >>> result.ok_value
         True
+        >>> create_filter(["line.length >"]).is_err()
+        True
     """
-    # If no expressions, create a pass-through filter
+    # If no expressions, use the pass-through filter
     if not expressions:
-        return lambda context: Ok(True)
-    
+        return Ok(no_filter)
+
+    match create_predicate(expressions):
+        case Err(error):
+            return Err(error)
+        case Ok(predicate):
+            pass
+
+    def fused_filter(context: MatchContext) -> FilterResult:
+        """Evaluate all clauses with AND logic in a single call."""
+        try:
+            return FILTER_PASS if predicate(context) else FILTER_REJECT
+        except Exception as e:
+            # Propagate evaluation errors
+            return Err(f"Evaluation error: {e}")
+
+    return Ok(fused_filter)
+
+def create_predicate(
+    expressions: list[FilterExpression]
+) -> Result[Callable[[MatchContext], bool], str]:
+    """Create an unboxed predicate from multiple where expressions.
+
+    Parses and compiles every expression once (AND logic). The returned
+    predicate yields a plain bool and raises on evaluation errors, so the
+    hot loop allocates no Result per line; build errors are reported once.
+    Predicates are pure, so they are memoized per expression sequence.
+
+    Args:
+        expressions: List of where clause strings
+
+    Returns:
+        Ok(predicate) or Err(message) if any expression fails to build
+
+    Examples:
+        >>> from bsce_mgrep.domain.types import Line, MatchContext
+        >>> predicate = create_predicate(["line.length > 10"]).ok_value
+        >>> predicate(MatchContext(line=Line(1, "ERROR: Database timeout"), groups={}))
+        True
+    """
+    return _build_predicate(tuple(expressions))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _build_predicate(
+    expressions: tuple[FilterExpression, ...]
+) -> Result[Callable[[MatchContext], bool], str]:
+    """Parse and compile where expressions (see create_predicate)."""
     # Parse all expressions into ASTs
     parsed_asts: list[ASTNode] = []
-    
+
     for expr in expressions:
         parse_result = parse_where_expression(expr)
-        
+
         match parse_result:
             case Ok(ast):
                 parsed_asts.append(ast)
             case Err(error):
-                # Return a filter that always fails with the parse error
-                return lambda context, err=error: Err(f"Parse error: {err}")
-    
-    # Create composite filter function
-    def composite_filter(context: MatchContext) -> FilterResult:
-        """Evaluate all ASTs with AND logic."""
-        for ast in parsed_asts:
-            eval_result = evaluate_where(ast, context)
-            
-            match eval_result:
-                case Ok(value):
-                    # If any filter returns False, short-circuit
-                    if not value:
-                        return Ok(False)
-                case Err(error):
-                    # Propagate evaluation errors
-                    return Err(error)
-        
-        # All filters passed
-        return Ok(True)
-    
-    return composite_filter
+                return Err(f"Parse error: {error}")
+
+    # Fuse all ASTs into one compiled predicate
+    try:
+        return Ok(compile_predicate(parsed_asts))
+    except ValueError as e:
+        # Unknown object/attribute/method/operator
+        return Err(f"Evaluation error: {e}")
 
 def combine_filters_and(
     filters: list[Callable[[MatchContext], FilterResult]]
 ) -> Callable[[MatchContext], FilterResult]:
     """Combine multiple filter functions with AND logic.
-    
+
     This is a more general combinator for pre-built filter functions.
-    
+
     Args:
         filters: List of filter functions
-        
+
     Returns:
         A composite filter that applies all filters with AND logic
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "test")
@@ -93,35 +152,33 @@ def combine_filters_and(
         True
     """
     if not filters:
-        return lambda context: Ok(True)
-    
+        return no_filter
+
     def combined(context: MatchContext) -> FilterResult:
         """Apply all filters with short-circuit AND logic."""
         for filter_fn in filters:
             result = filter_fn(context)
-            
-            match result:
-                case Ok(value):
-                    if not value:
-                        return Ok(False)
-                case Err(_):
-                    return result
-        
-        return Ok(True)
-    
+
+            if type(result) is not Ok:
+                return result
+            if not result.ok_value:
+                return FILTER_REJECT
+
+        return FILTER_PASS
+
     return combined
 
 def combine_filters_or(
     filters: list[Callable[[MatchContext], FilterResult]]
 ) -> Callable[[MatchContext], FilterResult]:
     """Combine multiple filter functions with OR logic.
-    
+
     Args:
         filters: List of filter functions
-        
+
     Returns:
         A composite filter that applies all filters with OR logic
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "test")
@@ -134,35 +191,33 @@ def combine_filters_or(
         True
     """
     if not filters:
-        return lambda context: Ok(False)
-    
+        return lambda context: FILTER_REJECT
+
     def combined(context: MatchContext) -> FilterResult:
         """Apply all filters with short-circuit OR logic."""
         for filter_fn in filters:
             result = filter_fn(context)
-            
-            match result:
-                case Ok(value):
-                    if value:
-                        return Ok(True)
-                case Err(_):
-                    return result
-        
-        return Ok(False)
-    
+
+            if type(result) is not Ok:
+                return result
+            if result.ok_value:
+                return FILTER_PASS
+
+        return FILTER_REJECT
+
     return combined
 
 def negate_filter(
     filter_fn: Callable[[MatchContext], FilterResult]
 ) -> Callable[[MatchContext], FilterResult]:
     """Negate a filter function (NOT logic).
-    
+
     Args:
         filter_fn: Filter function to negate
-        
+
     Returns:
         A filter that returns the opposite boolean result
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "test")
@@ -176,11 +231,9 @@ def negate_filter(
     def negated(context: MatchContext) -> FilterResult:
         """Negate the filter result."""
         result = filter_fn(context)
-        
-        match result:
-            case Ok(value):
-                return Ok(not value)
-            case Err(_):
-                return result
-    
+
+        if type(result) is not Ok:
+            return result
+        return FILTER_REJECT if result.ok_value else FILTER_PASS
+
     return negated
@@ -0,0 +1,164 @@
+"""Block prefiltering with Hyperscan.
+
+This module implements the optional Hyperscan engine (hyperscan package).
+Hyperscan searches a whole block of input in one SIMD-accelerated pass, but
+it only reports where matches end and captures no groups. It is therefore
+used as a prefilter: only the lines it flags are decoded and handed to the
+regular matcher, which decides the match and extracts named groups.
+"""
+
+import re
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from bsce_mgrep.domain.byte_scan import _INFO_SEPARATORS
+from bsce_mgrep.domain.matcher import MatchConfig, _compile, _has_divergent_syntax, pattern_options
+from bsce_mgrep.domain.types import Line
+from bsce_mgrep.utils.config import CACHE_SIZE
+
+if TYPE_CHECKING:
+    import hyperscan
+
+# Python anchors on the string (not the line) that Hyperscan reads differently
+_STRING_ANCHOR = re.compile(r'\\[AZzG]')
+
+# From the first byte that bytes matching may judge differently from text
+# matching (non-ASCII, carriage return, information separator) to line end
+_UNSAFE_LINE = re.compile(rb'[\r\x1c-\x1f\x80-\xff][^\n]*')
+
+# Byte value of b"\n", as bytes indexing returns it
+_NEWLINE = ord('\n')
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_hyperscan(config: MatchConfig) -> 'hyperscan.Database':
+    """Compile a pattern into a Hyperscan block-mode database.
+
+    The database is built with HS_FLAG_PREFILTER, so constructs Hyperscan
+    cannot match exactly (backreferences, lookaround) widen the prefilter
+    instead of failing, and HS_FLAG_MULTILINE, so ^ and $ hold at every
+    line boundary inside a block.
+
+    Databases are memoized per MatchConfig like matchers: compilation is
+    far costlier than a regex compile, and a database (with its scratch
+    space) can be reused by any number of sequential scans.
+
+    Args:
+        config: Match configuration with an ASCII pattern
+
+    Returns:
+        The compiled database
+
+    Raises:
+        ValueError: If hyperscan is not installed, the pattern is not ASCII,
+            can match the empty string, uses \\A, \\Z, \\z, \\G, {,n}, {,}
+            or POSIX-class brackets, or does not compile with re or Hyperscan
+
+    Examples:
+        >>> compile_hyperscan(MatchConfig(pattern="/a{,3}b/", case_sensitive=True))
+        Traceback (most recent call last):
+        ...
+        ValueError: Pattern not supported by Hyperscan: '/a{,3}b/'
+    """
+    options = pattern_options(config.pattern, config.case_sensitive)
+    source = options.source if options.is_regex else re.escape(options.source)
+
+    if not source.isascii() or _STRING_ANCHOR.search(source) or _has_divergent_syntax(source):
+        raise ValueError(f"Pattern not supported by Hyperscan: {config.pattern!r}")
+
+    try:
+        # Hyperscan accepts syntax re rejects (e.g. \\Q...\\E); let re report it
+        regex = _compile(source, options.flags)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}") from e
+
+    if regex.search(''):
+        # Empty lines would match, and Hyperscan does not reliably report
+        # empty matches
+        raise ValueError(f"Pattern not supported by Hyperscan: {config.pattern!r}")
+
+    try:
+        import hyperscan
+    except ImportError as e:
+        raise ValueError("Hyperscan engine requires the hyperscan package") from e
+
+    flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_MULTILINE
+    if options.flags & re.IGNORECASE:
+        flags |= hyperscan.HS_FLAG_CASELESS
+
+    database = hyperscan.Database()
+    try:
+        database.compile(expressions=[source.encode('ascii')], flags=[flags])
+    except hyperscan.error as e:
+        raise ValueError(f"Pattern not supported by Hyperscan: {e}") from e
+
+    return database
+
+def scan_candidate_lines(
+    blocks: Iterator[bytes],
+    database: 'hyperscan.Database',
+    decode: Callable[[bytes], str] = bytes.decode
+) -> Iterator[Line]:
+    """Yield the lines that may match, skipping lines that cannot.
+
+    On ASCII lines without a carriage return or information separator,
+    bytes semantics equal the text semantics of the pattern, so any such
+    line the pattern matches contains a reported match end, or starts at one
+    (zero-width matches such as /^\\b/). All other lines are passed through
+    for the matcher to decide.
+
+    Args:
+        blocks: Iterator of UTF-8 byte blocks made of whole lines
+        database: Result of compile_hyperscan(config)
+        decode: Line decoder (UTF-8 by default)
+
+    Yields:
+        Candidate Lines, numbered from 1, in input order
+    """
+    scan = database.scan
+    find_unsafe = _UNSAFE_LINE.finditer
+    ends: list[int] = []
+
+    def record_end(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        ends.append(end)
+
+    # Number of newlines seen before the current block
+    line_count = 0
+
+    for block in blocks:
+        ends.clear()
+        scan(block, match_event_handler=record_end)
+
+        if not block.isascii() or b'\r' in block or _INFO_SEPARATORS.search(block):
+            # Each unsafe line counts as a match ending on its last byte
+            ends.extend(match.end() for match in find_unsafe(block))
+            ends.sort()
+
+        # Position up to which newlines have been added to line_count
+        counted = 0
+        # Start of the first line not yielded yet
+        next_start = 0
+
+        for end in ends:
+            if end and block[end - 1] != _NEWLINE:
+                # The match ends with the byte at end - 1, inside its line
+                start = block.rfind(b'\n', 0, end - 1) + 1
+            else:
+                # A zero-width match at a line start (e.g. /^\\b/); a match
+                # ending on a newline also lands here, but any line the
+                # pattern matches has a match end of its own
+                start = end
+
+            if start < next_start or start == len(block):
+                continue
+
+            line_end = block.find(b'\n', max(start, end - 1))
+            if line_end < 0:
+                line_end = len(block)
+
+            line_count += block.count(b'\n', counted, start)
+            counted = start
+            yield Line(line_count + 1, decode(block[start:line_end].removesuffix(b'\r')))
+            next_start = line_end + 1
+
+        line_count += block.count(b'\n', counted)
@@ -0,0 +1,117 @@
+"""Bulk literal scanning over raw byte blocks.
+
+This module implements the fast path for plain literal patterns without
+where clauses. Instead of decoding and testing every line, whole blocks of
+input are searched with C-level bytes.find; only the lines containing a hit
+are ever sliced out, so non-matching lines cost no Python-level work.
+"""
+
+from collections.abc import Callable, Iterator
+
+# UTF-8 encodings of the only non-ASCII characters whose str.lower() contains
+# ASCII: U+0130 (capital I with dot above) and U+212A (Kelvin sign)
+_ASCII_LOWERING = ('\u0130'.encode('utf-8'), '\u212a'.encode('utf-8'))
+
+def scan_literal(
+    blocks: Iterator[bytes],
+    needle: str,
+    case_sensitive: bool,
+    decode: Callable[[bytes], str] = bytes.decode
+) -> Iterator[tuple[int, bytes]]:
+    """Find the lines containing a literal needle in blocks of whole lines.
+
+    Each block must end on a line boundary (see split_blocks). Matching is
+    equivalent to `needle in line` (or `needle.lower() in line.lower()`)
+    on the UTF-8 decoded line content:
+    - Case-sensitive: the UTF-8 encoded needle is searched in the raw bytes
+      (UTF-8 is self-synchronizing, so byte hits are exactly str hits)
+    - Case-insensitive: blocks are lowered as bytes, which only touches
+      ASCII letters. For an ASCII needle this equals str.lower() matching
+      unless the block contains one of the two non-ASCII characters that
+      lower to ASCII (see _ASCII_LOWERING); such blocks are decoded and
+      lowered per line
+
+    Args:
+        blocks: Iterator of UTF-8 byte blocks made of whole lines
+        needle: Literal pattern (non-empty, no newline or carriage return;
+            ASCII when case-insensitive)
+        case_sensitive: Whether matching should be case-sensitive
+        decode: Line decoder used by the per-line fallback (UTF-8 by default)
+
+    Yields:
+        (line_number, raw_line) for each matching line, without its newline
+
+    Examples:
+        >>> list(scan_literal(iter([b"ERROR: a\\nINFO: b\\n", b"error: c"]), "ERROR", False))
+        [(1, b'ERROR: a'), (3, b'error: c')]
+    """
+    search = needle.encode('utf-8') if case_sensitive else needle.lower().encode('ascii')
+    lowered = needle.lower()
+
+    # Number of newlines seen before the current block
+    line_count = 0
+
+    for block in blocks:
+        if case_sensitive:
+            haystack = block
+        elif block.isascii() or not _lowers_to_ascii(block):
+            haystack = block.lower()
+        else:
+            for offset, raw in enumerate(block.split(b'\n')):
+                if lowered in decode(raw).lower():
+                    yield line_count + offset + 1, raw.removesuffix(b'\r')
+            line_count += block.count(b'\n')
+            continue
+
+        find = haystack.find
+        # Position up to which newlines have been added to line_count
+        counted = 0
+        start = 0
+
+        while (hit := find(search, start)) >= 0:
+            start = haystack.rfind(b'\n', 0, hit) + 1
+            end = find(b'\n', hit)
+            if end < 0:
+                end = len(block)
+
+            line_count += block.count(b'\n', counted, start)
+            counted = start
+            yield line_count + 1, block[start:end].removesuffix(b'\r')
+            start = end + 1
+
+        line_count += block.count(b'\n', counted)
+
+def can_scan_literal(pattern: str, case_sensitive: bool) -> bool:
+    """Check whether a literal pattern can be matched by scan_literal.
+
+    Args:
+        pattern: Literal pattern (regex patterns must be excluded by the caller)
+        case_sensitive: Whether matching should be case-sensitive
+
+    Returns:
+        True if the pattern is non-empty, stays within one line and, when
+        case-insensitive, is ASCII
+
+    Examples:
+        >>> can_scan_literal("ERROR", False)
+        True
+        >>> can_scan_literal("ÉRROR", False)
+        False
+    """
+    return (
+        bool(pattern)
+        and '\n' not in pattern
+        and '\r' not in pattern
+        and (case_sensitive or pattern.isascii())
+    )
+
+def _lowers_to_ascii(block: bytes) -> bool:
+    """Check whether str.lower() of the block could create ASCII letters.
+
+    Examples:
+        >>> _lowers_to_ascii("caf\u00e9".encode('utf-8'))
+        False
+        >>> _lowers_to_ascii("\u212a".encode('utf-8'))
+        True
+    """
+    return any(encoded in block for encoded in _ASCII_LOWERING)
@@ -4,25 +4,54 @@ This module implements literal and regex pattern matching with Railway-Oriented
 error handling. Matchers are pure functions that transform Lines into MatchContexts.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Callable
+from functools import lru_cache
+from typing import Any, Callable, Literal, NamedTuple, cast
+import importlib
 import re
 from result import Ok, Err
 
-from bsce_mgrep.domain.types import Line, MatchContext, MatchResult, PatternString
+from bsce_mgrep.domain.types import (
+    Line, LineBatch, MatchContext, MatchResult, PatternString, NO_GROUPS, NO_MATCH
+)
+from bsce_mgrep.utils.config import CACHE_SIZE
+
+# Unboxed matchers: one line to its match (or None), one batch to its matches
+type LineMatcher = Callable[[Line], MatchContext | None]
+type BatchMatcher = Callable[[LineBatch], list[MatchContext]]
 
 # Regex pattern delimiter
 REGEX_DELIMITER = '/'
 MIN_REGEX_LENGTH = 3  # Minimum: /x/
 
+# Regex engines: Python's backtracking re, RE2 (optional google-re2 package),
+# or re behind a Hyperscan block prefilter (optional hyperscan package)
+type RegexEngine = Literal['re', 're2', 'hyperscan']
+
+# Literal sets at least this large are searched with one Aho-Corasick
+# automaton (optional pyahocorasick package) instead of one scan per needle
+AHO_CORASICK_THRESHOLD = 32
+
+# Shortest required literal worth a substring prefilter before a regex search
+MIN_PREFILTER_LENGTH = 3
+
 @dataclass(frozen=True, slots=True)
 class MatchConfig:
     """Configuration for pattern matching.
-    
+
     Attributes:
         pattern: The pattern to match (literal or /regex/)
         case_sensitive: Whether matching should be case-sensitive
-        
+        engine: Regex engine for /regex/ patterns. 're2' guarantees linear
+            time (no catastrophic backtracking) but costs more per call; it
+            falls back to 're' when google-re2 is not installed or the
+            pattern uses features RE2 lacks (backreferences, lookaround)
+            or reads differently (\\w, \\d, \\s, \\b and their negations,
+            {,n}, POSIX-class brackets).
+            'hyperscan' only affects block scans (see hyperscan_scan); line
+            matchers use 're'
+
     Examples:
         >>> config = MatchConfig(pattern="ERROR", case_sensitive=False)
         >>> config.pattern
@@ -30,20 +59,29 @@ class MatchConfig:
     """
     pattern: PatternString
     case_sensitive: bool
+    engine: RegexEngine = 're'
 
+@lru_cache(maxsize=CACHE_SIZE)
 def create_matcher(config: MatchConfig) -> Callable[[Line], MatchResult]:
     """Factory function that creates a pattern matcher.
-    
+
     Detects pattern type and returns appropriate matcher:
     - Wrapped in /.../ → regex matcher
     - Plain string → literal matcher
-    
+
+    Matchers are pure, so they are memoized per MatchConfig: repeated calls
+    with an equal config return the same function without recompiling.
+
     Args:
         config: Configuration specifying pattern and case sensitivity
-        
+
     Returns:
         A pure matcher function: Line → Result[MatchContext, str]
-        
+
+    Raises:
+        ValueError: If the pattern is invalid (e.g. a /regex/ that does not
+            compile), so the error surfaces once instead of on every line
+
     Examples:
         >>> config = MatchConfig(pattern="ERROR", case_sensitive=False)
         >>> matcher = create_matcher(config)
@@ -51,25 +89,322 @@ def create_matcher(config: MatchConfig) -> Callable[[Line], MatchResult]:
         >>> result = matcher(line)
         >>> isinstance(result, Ok)
         True
+        >>> create_matcher(MatchConfig(pattern="/(/", case_sensitive=True))
+        Traceback (most recent call last):
+        ...
+        ValueError: Invalid regex pattern: missing ), unterminated subpattern at position 0
+    """
+    match_line = _build_line_matcher(config)
+
+    def matcher(line: Line) -> MatchResult:
+        """Box the unboxed matcher's outcome into a Result.
+
+        Misses (most lines) share the NO_MATCH constant, so only matching
+        lines allocate a Result.
+        """
+        context = match_line(line)
+
+        if context is None:
+            return NO_MATCH
+        return Ok(context)
+
+    return matcher
+
+@lru_cache(maxsize=CACHE_SIZE)
+def create_line_matcher(config: MatchConfig) -> LineMatcher:
+    """Factory function that creates an unboxed pattern matcher.
+
+    Same matching rules as create_matcher, but the returned function yields
+    the MatchContext directly and None on a miss, so the hot loop allocates
+    nothing for the (common) non-matching lines.
+
+    Invalid patterns produce a matcher that matches no line.
+
+    Args:
+        config: Configuration specifying pattern and case sensitivity
+
+    Returns:
+        A pure matcher function: Line → MatchContext | None
+
+    Examples:
+        >>> matcher = create_line_matcher(MatchConfig(pattern="ERROR", case_sensitive=False))
+        >>> matcher(Line(1, "error: timeout")) is not None
+        True
+        >>> matcher(Line(2, "INFO: ok")) is None
+        True
+    """
+    try:
+        return _build_line_matcher(config)
+    except ValueError:
+        return lambda line: None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def create_batch_matcher(config: MatchConfig) -> BatchMatcher:
+    """Factory function that creates a matcher for whole batches of lines.
+
+    Same matching rules as create_line_matcher, applied to a LineBatch at
+    once; Line objects are only built for matching lines. Where possible
+    the batch is joined with newlines and searched by a single C-level scan
+    that stops only at lines with a hit:
+    - Literals: str.find on the joined (lowered) contents
+    - Regexes: re.search on the joined contents, compiled with MULTILINE
+      so ^ and $ hold at each line boundary
+
+    The scan restarts at the line after each hit. A leftmost match never
+    starts after a line that matches on its own, so no matching line is
+    skipped. Regexes whose outcome can depend on text beyond the line (see
+    _JOINED_SEARCH_UNSAFE) and the RE2 engine are matched line by line.
+
+    Args:
+        config: Configuration specifying pattern and case sensitivity
+
+    Returns:
+        A function mapping a batch of lines to its matches, in order
+
+    Examples:
+        >>> config = MatchConfig(pattern="/(?P<level>ERROR|WARN)/", case_sensitive=True)
+        >>> batch = LineBatch(range(1, 4), ["WARN: a", "INFO", "ERROR: b"])
+        >>> [(ctx.line.number, ctx.groups) for ctx in create_batch_matcher(config)(batch)]
+        [(1, {'level': 'WARN'}), (3, {'level': 'ERROR'})]
+    """
+    options = pattern_options(config.pattern, config.case_sensitive)
+
+    if not options.is_regex and config.pattern and '\n' not in config.pattern:
+        return _create_literal_batch_matcher(config)
+
+    joinable = options.is_regex and not _JOINED_SEARCH_UNSAFE.search(options.source)
+    if joinable and config.engine != 're2':
+        try:
+            joined_regex = _compile(options.source, options.flags | re.MULTILINE)
+        except re.error:
+            pass
+        else:
+            return _create_regex_batch_matcher(config, joined_regex)
+
+    return _per_line(create_line_matcher(config))
+
+def _per_line(match_line: LineMatcher) -> BatchMatcher:
+    """Turn a line matcher into a batch matcher that tries each line."""
+    return lambda batch: [
+        context for line in map(Line, *batch) if (context := match_line(line)) is not None
+    ]
+
+# Regex constructs that can reject a line's match once the line is embedded
+# in joined text: negative lookaround, atomic groups, possessive quantifiers,
+# string anchors and scoped flag removal (e.g. turning MULTILINE off)
+_JOINED_SEARCH_UNSAFE = re.compile(r'\(\?(?:<?!|>|[a-zA-Z]*-)|[*+?}]\+|\\[AZz]')
+
+# Lookaround can make a hit inside a line depend on the neighbouring lines
+_LOOKAROUND = re.compile(r'\(\?<?[=!]')
+
+# Escapes (group 1: the escaped character) and unescaped syntax that RE2
+# and Hyperscan read differently from re (group 2): {,n} and {,} repeats,
+# literal text to both, and bracket sequences that both read as POSIX
+# classes (e.g. [[:alpha:]]) but re reads as a nested set
+_ENGINE_SYNTAX = re.compile(r'\\(.)|(\{,\d*\}|\[[:.=])', re.DOTALL)
+
+# Escaped classes and boundaries that are ASCII-only in RE2 but Unicode-aware
+# in re's str patterns
+_UNICODE_ESCAPES = 'wWdDsSbB'
+
+def _create_literal_batch_matcher(config: MatchConfig) -> BatchMatcher:
+    """Create a batch matcher for a literal pattern without newlines.
+
+    Hits of a newline-free needle never span lines, so every hit is a match
+    of its line. Case-insensitive batches are lowered as a whole; lowering
+    keeps every newline and newlines break the context str.lower() looks
+    at, so this equals lowering each line. That only pays off for ASCII
+    batches: one non-ASCII line widens the joined string and sends the
+    whole batch through the slow Unicode lowering, so such batches are
+    matched line by line instead.
+    """
+    needle = config.pattern if config.case_sensitive else config.pattern.lower()
+    lowered = not config.case_sensitive
+    match_lines = _per_line(create_line_matcher(config))
+
+    def batch_matcher(batch: LineBatch) -> list[MatchContext]:
+        """Find the lines containing the needle in the joined batch."""
+        numbers, contents = batch
+        haystack = '\n'.join(contents)
+        if lowered:
+            if not haystack.isascii():
+                return match_lines(batch)
+            haystack = haystack.lower()
+
+        find = haystack.find
+        count = haystack.count
+        contexts = []
+        # Search position (always a line start) and index of its line
+        position = 0
+        index = 0
+
+        while (start := find(needle, position)) >= 0:
+            index += count('\n', position, start)
+            # Literal matches have no captured groups
+            contexts.append(MatchContext(Line(numbers[index], contents[index]), NO_GROUPS))
+
+            position = find('\n', start) + 1
+            if not position:
+                break
+            index += 1
+
+        return contexts
+
+    return batch_matcher
+
+def _create_regex_batch_matcher(
+    config: MatchConfig,
+    joined_regex: re.Pattern[str]
+) -> BatchMatcher:
+    """Create a batch matcher searching the joined batch with joined_regex.
+
+    Without lookaround, a hit that stays inside its line is exactly the
+    line's own leftmost match (same span and groups): any path that
+    succeeds on the line alone also succeeds in the joined text. Other
+    hits are re-checked with the line matcher.
+
+    If the regex has a required literal worth prefiltering on (see
+    _batch_prefilter_literal), the batch is scanned for the literal instead,
+    and the regex only searches the lines containing it, bounded to the line.
+    """
+    match_line = create_line_matcher(config)
+    search = joined_regex.search
+    exact_in_line = not _LOOKAROUND.search(joined_regex.pattern)
+    has_groups = bool(joined_regex.groupindex)
+    literal = _batch_prefilter_literal(joined_regex.pattern, joined_regex.flags)
+
+    def batch_matcher(batch: LineBatch) -> list[MatchContext]:
+        """Match the lines with a hit in the joined batch."""
+        numbers, contents = batch
+        haystack = '\n'.join(contents)
+        find = haystack.find
+        count = haystack.count
+        size = len(haystack)
+        contexts = []
+        # Search position (always a line start) and index of its line
+        position = 0
+        index = 0
+
+        while contents and (match := search(haystack, position)) is not None:
+            start = match.start()
+            index += count('\n', position, start)
+            line_end = find('\n', start)
+            if line_end < 0:
+                line_end = size
+
+            line = Line(numbers[index], contents[index])
+            if exact_in_line and match.end() <= line_end:
+                contexts.append(MatchContext(line, match.groupdict() if has_groups else NO_GROUPS))
+            elif (context := match_line(line)) is not None:
+                contexts.append(context)
+
+            position = line_end + 1
+            if position > size:
+                break
+            index += 1
+
+        return contexts
+
+    def prefiltered_batch_matcher(batch: LineBatch) -> list[MatchContext]:
+        """Match the lines containing the required literal."""
+        numbers, contents = batch
+        haystack = '\n'.join(contents)
+        find = haystack.find
+        rfind = haystack.rfind
+        count = haystack.count
+        size = len(haystack)
+        contexts = []
+        # Search position (always a line start) and index of its line
+        position = 0
+        index = 0
+
+        while (hit := find(literal, position)) >= 0:
+            line_start = rfind('\n', position, hit) + 1 or position
+            index += count('\n', position, line_start)
+            line_end = find('\n', hit)
+            if line_end < 0:
+                line_end = size
+
+            # Searching [line_start, line_end) sees the line as a whole string
+            if (match := search(haystack, line_start, line_end)) is not None:
+                line = Line(numbers[index], contents[index])
+                if exact_in_line:
+                    groups = match.groupdict() if has_groups else NO_GROUPS
+                    contexts.append(MatchContext(line, groups))
+                elif (context := match_line(line)) is not None:
+                    contexts.append(context)
+
+            position = line_end + 1
+            if position > size:
+                break
+            index += 1
+
+        return contexts
+
+    if literal:
+        return prefiltered_batch_matcher
+    return batch_matcher
+
+class PatternOptions(NamedTuple):
+    """Facts derived once from a pattern and its case sensitivity.
+
+    Attributes:
+        is_regex: Whether the pattern is a /regex/
+        flags: re module flags for the configured case sensitivity
+        source: Pattern text without /.../ delimiters
+    """
+    is_regex: bool
+    flags: int
+    source: str
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pattern_options(pattern: PatternString, case_sensitive: bool) -> PatternOptions:
+    """Classify a pattern once per (pattern, case_sensitive) for the process.
+
+    Every matcher factory needs the same classification, flags and delimiter
+    stripping; caching it turns repeated factory calls into a lookup.
+
+    Args:
+        pattern: The pattern to classify (literal or /regex/)
+        case_sensitive: Whether matching should be case-sensitive
+
+    Returns:
+        The derived PatternOptions
+
+    Examples:
+        >>> pattern_options("/ERROR (?P<code>\\\\d+)/", False).is_regex
+        True
+        >>> pattern_options("ERROR", True)
+        PatternOptions(is_regex=False, flags=0, source='ERROR')
+    """
+    is_regex = _is_regex_pattern(pattern)
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return PatternOptions(is_regex, flags, pattern[1:-1] if is_regex else pattern)
+
+def _build_line_matcher(config: MatchConfig) -> LineMatcher:
+    """Dispatch on pattern type to build an unboxed matcher.
+
+    Raises:
+        ValueError: If the pattern is empty or the regex does not compile
     """
     match config.pattern:
-        case str() if _is_regex_pattern(config.pattern):
+        case str() if pattern_options(config.pattern, config.case_sensitive).is_regex:
             return _create_regex_matcher(config)
         case str() if config.pattern:
             return _create_literal_matcher(config)
         case _:
             # Empty pattern or invalid type
-            return lambda line: Err(f"Invalid pattern: {config.pattern!r}")
+            raise ValueError(f"Invalid pattern: {config.pattern!r}")
 
 def _is_regex_pattern(pattern: str) -> bool:
     """Check if pattern is wrapped in /.../ delimiters.
-    
+
     Args:
         pattern: Pattern string to check
-        
+
     Returns:
         True if pattern has regex delimiters
-        
+
     Examples:
         >>> _is_regex_pattern("/test/")
         True
@@ -84,87 +419,425 @@ def _is_regex_pattern(pattern: str) -> bool:
         and pattern.endswith(REGEX_DELIMITER)
     )
 
-def _create_regex_matcher(config: MatchConfig) -> Callable[[Line], MatchResult]:
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(pattern: str | bytes, flags: int) -> re.Pattern[Any]:
+    """Compile a regex once per (pattern, flags) for the whole process.
+
+    Hits return the cached re.Pattern without going through re.compile's
+    flag handling and internal cache lookup.
+
+    Args:
+        pattern: Regex source (without /.../ delimiters), as str or bytes
+        flags: re module flags
+
+    Returns:
+        The compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid (errors are not cached)
+    """
+    return re.compile(pattern, flags)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_re2(pattern: str, flags: int) -> re.Pattern[str] | None:
+    """Compile a regex with RE2, once per (pattern, flags) for the process.
+
+    Args:
+        pattern: Regex source (without /.../ delimiters)
+        flags: re module flags (only re.IGNORECASE is honoured)
+
+    Returns:
+        The compiled pattern (RE2 patterns and their match objects mirror
+        re.Pattern and re.Match), or None if google-re2 is not installed,
+        RE2 does not support the pattern or would match it differently
+        (e.g. \\w and \\d are ASCII-only in RE2)
+    """
+    if _has_divergent_syntax(pattern, _UNICODE_ESCAPES):
+        return None
+
+    try:
+        import re2
+    except ImportError:
+        return None
+
+    options = re2.Options()
+    options.case_sensitive = not flags & re.IGNORECASE
+    # Unsupported patterns fall back to re, so keep RE2 from logging them
+    options.log_errors = False
+
+    try:
+        return cast(re.Pattern[str], re2.compile(pattern, options))
+    except re2.error:
+        return None
+
+def _has_divergent_syntax(source: str, escapes: str = '') -> bool:
+    """Check whether a pattern uses syntax RE2 or Hyperscan reads unlike re.
+
+    Args:
+        source: Regex source (without /.../ delimiters)
+        escapes: Escaped characters that diverge as well (e.g. _UNICODE_ESCAPES)
+
+    Examples:
+        >>> _has_divergent_syntax(r"a{,3}"), _has_divergent_syntax(r"a\\{,3}")
+        (True, False)
+        >>> _has_divergent_syntax(r"\\w+"), _has_divergent_syntax(r"\\w+", _UNICODE_ESCAPES)
+        (False, True)
+    """
+    return any(
+        match[2] or match[1] in escapes for match in _ENGINE_SYNTAX.finditer(source)
+    )
+
+def _create_regex_matcher(config: MatchConfig) -> LineMatcher:
     """Create a regex matcher with named group support.
-    
+
     Extracts pattern between delimiters, compiles regex, and returns a matcher
     that captures named groups for use in where clauses.
-    
+
     Args:
         config: Match configuration with regex pattern
-        
+
     Returns:
-        A matcher function that extracts regex groups
-        
+        A matcher function that extracts regex groups (None on no match)
+
+    Raises:
+        ValueError: If the regex does not compile
+
     Examples:
-        >>> config = MatchConfig(pattern="/status=(?P<code>\\d+)/", case_sensitive=True)
+        >>> config = MatchConfig(pattern="/status=(?P<code>\\\\d+)/", case_sensitive=True)
         >>> matcher = _create_regex_matcher(config)
         >>> line = Line(1, "status=500")
-        >>> result = matcher(line)
-        >>> result.ok_value.groups["code"]
+        >>> matcher(line).groups["code"]
         '500'
     """
-    # Extract pattern between delimiters
-    regex_pattern = config.pattern[1:-1]
-    
-    # Compile regex with appropriate flags
+    # Pattern between delimiters, with flags for the case sensitivity
+    options = pattern_options(config.pattern, config.case_sensitive)
+
+    # Compile regex with appropriate flags, preferring RE2 when configured
+    compiled_regex = (
+        _compile_re2(options.source, options.flags) if config.engine == 're2' else None
+    )
+
+    if compiled_regex is None:
+        try:
+            compiled_regex = _compile(options.source, options.flags)
+        except re.error as e:
+            raise ValueError(f"Invalid regex pattern: {e}") from e
+
+    # Bound once, so each call skips the attribute lookup
+    search = compiled_regex.search
+
+    # Lines without the regex's required literal (if any) are rejected by
+    # a C-level substring test before the regex engine is entered
+    literal = _required_literal(options.source, options.flags)
+    test = "_search(line[1])"
+    if len(literal) >= MIN_PREFILTER_LENGTH:
+        test = "_literal in line[1] and " + test
+
+    # Named groups are extracted for where clauses; without any, every
+    # match shares NO_GROUPS instead of allocating an empty dict
+    if compiled_regex.groupindex:
+        return _generate_matcher(
+            f"(match := {test})", "match.groupdict()", _search=search, _literal=literal
+        )
+    return _generate_matcher(test, "_no_groups", _search=search, _literal=literal)
+
+# re's parser is a private module: if it is missing or its names differ,
+# _required_literal finds no literal and regexes run without a prefilter
+_parser: Any
+_REPEATS: tuple[Any, ...]
+try:
+    _parser = importlib.import_module('re._parser')
+    # Repeats whose body must occur at least once when min >= 1
+    _REPEATS = (_parser.MAX_REPEAT, _parser.MIN_REPEAT, _parser.POSSESSIVE_REPEAT)
+except (ImportError, AttributeError):
+    _parser = None
+    _REPEATS = ()
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _required_literal(source: str, flags: int) -> str:
+    """Find the longest literal that every match of a regex contains.
+
+    Walks the parse tree from re's own parser and collects runs of literal
+    characters that lie on every path: the top-level sequence, groups, and
+    bodies of repeats with a minimum of at least one. Alternations, optional
+    parts and case-insensitive parts contribute nothing.
+
+    Args:
+        source: Regex source (without /.../ delimiters)
+        flags: re module flags the regex is compiled with
+
+    Returns:
+        The longest required literal, or "" if there is none (or re's
+        parser is unavailable)
+
+    Examples:
+        >>> _required_literal(r"(?P<user>\\w+) login (failed|denied)", 0)
+        ' login '
+        >>> _required_literal(r"ERROR|WARN", 0)
+        ''
+    """
+    if _parser is None:
+        return ''
+
     try:
-        flags = 0 if config.case_sensitive else re.IGNORECASE
-        compiled_regex = re.compile(regex_pattern, flags)
-    except re.error as e:
-        # Return a matcher that always fails with the compilation error
-        error_message = f"Invalid regex pattern: {e}"
-        return lambda line: Err(error_message)
-    
-    def matcher(line: Line) -> MatchResult:
-        """Match line content against compiled regex."""
-        match = compiled_regex.search(line.content)
-        
-        if match:
-            # Extract named groups (empty dict if no groups)
-            groups = match.groupdict()
-            return Ok(MatchContext(line=line, groups=groups))
-        else:
-            return Err(f"No match at line {line.number}")
-    
-    return matcher
+        parsed = _parser.parse(source, flags)
+    except re.error:
+        return ''
+
+    if parsed.state.flags & re.IGNORECASE:
+        return ''
+
+    runs: list[str] = []
+    _collect_literal_runs(parsed, runs)
+    return max(runs, key=len, default='')
+
+def _batch_prefilter_literal(source: str, flags: int) -> str:
+    """Return the required literal a batch search should prefilter on, or "".
+
+    A literal the regex starts with is already searched for by the regex
+    engine itself, without a round trip through Python per candidate line.
+    """
+    literal = _required_literal(source, flags)
+    if len(literal) < MIN_PREFILTER_LENGTH or source.startswith(literal):
+        return ''
+    return literal
+
+def _collect_literal_runs(items: Iterable[tuple[Any, Any]], runs: list[str]) -> None:
+    """Append the required runs of literal characters in a parsed sequence."""
+    run: list[str] = []
+
+    for op, value in items:
+        if op is _parser.LITERAL:
+            run.append(chr(value))
+            continue
+
+        # Anything else ends the current run
+        if run:
+            runs.append(''.join(run))
+            run = []
+
+        if op is _parser.SUBPATTERN:
+            _group, add_flags, _del_flags, body = value
+            if not add_flags & re.IGNORECASE:
+                _collect_literal_runs(body, runs)
+        elif op is _parser.ATOMIC_GROUP:
+            _collect_literal_runs(value, runs)
+        elif op in _REPEATS and value[0] >= 1:
+            _collect_literal_runs(value[2], runs)
 
-def _create_literal_matcher(config: MatchConfig) -> Callable[[Line], MatchResult]:
+    if run:
+        runs.append(''.join(run))
+
+def _create_literal_matcher(config: MatchConfig) -> LineMatcher:
     """Create a literal string matcher.
-    
+
     Performs simple substring matching with optional case sensitivity.
-    No regex groups are captured.
-    
+    No regex groups are captured. The re module is never involved: the
+    case-sensitive matcher is a bare `in` test on the line content.
+
     Args:
         config: Match configuration with literal pattern
-        
+
     Returns:
-        A matcher function for literal string matching
-        
+        A matcher function for literal string matching (None on no match)
+
     Examples:
         >>> config = MatchConfig(pattern="ERROR", case_sensitive=False)
         >>> matcher = _create_literal_matcher(config)
         >>> line = Line(1, "error: timeout")
-        >>> result = matcher(line)
-        >>> isinstance(result, Ok)
+        >>> matcher(line) is not None
         True
     """
-    # Prepare pattern and content transformation based on case sensitivity
+    # Literal matches have no captured groups
     if config.case_sensitive:
-        search_pattern = config.pattern
-        transform = lambda s: s
-    else:
-        search_pattern = config.pattern.lower()
-        transform = lambda s: s.lower()
-    
-    def matcher(line: Line) -> MatchResult:
-        """Match line content against literal pattern."""
-        transformed_content = transform(line.content)
-        
-        if search_pattern in transformed_content:
+        # C-level substring search on the content
+        return _generate_matcher("_needle in line[1]", "_no_groups", _needle=config.pattern)
+
+    # Case-insensitive: lower the pattern once and each line inline.
+    # str.lower() + `in` measures several times faster than an escaped
+    # re.IGNORECASE search, and keeps str.lower() semantics for non-ASCII.
+    return _generate_matcher(
+        "_needle in line[1].lower()", "_no_groups", _needle=config.pattern.lower()
+    )
+
+# Source of a generated single-pattern matcher (see _generate_matcher)
+_MATCHER_SOURCE = """\
+def matcher(line):
+    if {test}:
+        return _context(line, {groups})
+    return None
+"""
+
+def _generate_matcher(test: str, groups: str, **constants: object) -> LineMatcher:
+    """Compile a matcher function specialized for one pattern.
+
+    Like compile_predicate for where clauses, the per-pattern choices are
+    made while writing the source, so the generated function is monomorphic:
+    one test, constants read from its own namespace instead of closure
+    cells, and the content fetched as line[1] (Line.content), which the
+    interpreter specializes as a tuple index rather than an attribute load.
+
+    Args:
+        test: Expression on `line` that is true for a match
+        groups: Expression for the captured groups, evaluated after `test`
+        constants: Values the expressions refer to by name
+
+    Returns:
+        A matcher function: Line → MatchContext | None
+
+    Examples:
+        >>> matcher = _generate_matcher("_needle in line[1]", "_no_groups", _needle="ERROR")
+        >>> matcher(Line(1, "ERROR: timeout"))
+        MatchContext(line=Line(number=1, content='ERROR: timeout'), groups=mappingproxy({}))
+    """
+    source = _MATCHER_SOURCE.format(test=test, groups=groups)
+
+    # Minimal namespace: the source only references these names
+    namespace: dict[str, object] = {
+        '__builtins__': {}, '_context': MatchContext, '_no_groups': NO_GROUPS, **constants
+    }
+    exec(compile(source, '<matcher>', 'exec'), namespace)
+    return cast(LineMatcher, namespace['matcher'])
+
+@lru_cache(maxsize=CACHE_SIZE)
+def create_multi_literal_matcher(configs: tuple[MatchConfig, ...]) -> LineMatcher:
+    """Create one unboxed matcher for several literal patterns (OR logic).
+
+    A line matches if any pattern would match it on its own. The line is
+    lowered at most once for all case-insensitive patterns, and large
+    pattern sets share a single Aho-Corasick pass when pyahocorasick is
+    installed. Matchers are memoized per configuration tuple, so the
+    automaton is built once per pattern set.
+
+    Args:
+        configs: Configurations of literal (non-regex, non-empty) patterns
+
+    Returns:
+        A matcher function: Line → MatchContext | None
+
+    Raises:
+        ValueError: If a pattern is empty or a /regex/
+
+    Examples:
+        >>> matcher = create_multi_literal_matcher((
+        ...     MatchConfig(pattern="ERROR", case_sensitive=True),
+        ...     MatchConfig(pattern="warn", case_sensitive=False),
+        ... ))
+        >>> matcher(Line(1, "WARN: low memory")) is not None
+        True
+        >>> matcher(Line(2, "error: lower case")) is None
+        True
+    """
+    for config in configs:
+        if not config.pattern or pattern_options(config.pattern, config.case_sensitive).is_regex:
+            raise ValueError(f"Not a literal pattern: {config.pattern!r}")
+
+    # dict.fromkeys drops duplicates and keeps the given order
+    exact = _any_needle_in(tuple(dict.fromkeys(
+        config.pattern for config in configs if config.case_sensitive
+    )))
+    folded = _any_needle_in(tuple(dict.fromkeys(
+        config.pattern.lower() for config in configs if not config.case_sensitive
+    )))
+
+    def matcher(line: Line) -> MatchContext | None:
+        """Match line content against every literal pattern."""
+        content = line.content
+
+        if (exact is not None and exact(content)) or (
+            folded is not None and folded(content.lower())
+        ):
             # Literal matches have no captured groups
-            return Ok(MatchContext(line=line, groups={}))
-        else:
-            return Err(f"No match at line {line.number}")
-    
+            return MatchContext(line=line, groups=NO_GROUPS)
+        return None
+
     return matcher
+
+def compose_patterns(configs: list[MatchConfig]) -> Callable[[Line], MatchResult]:
+    """Compose several patterns with OR logic, like pipeline.compose_matchers.
+
+    Taking configurations instead of opaque matchers lets an all-literal
+    set be fused into a single matcher that scans each line once (see
+    create_multi_literal_matcher). Sets containing a /regex/ try one
+    matcher per pattern, in order.
+
+    Args:
+        configs: Match configurations, tried in order
+
+    Returns:
+        A composite matcher: Line → Result[MatchContext, str]
+
+    Raises:
+        ValueError: If any pattern is invalid (see create_matcher)
+
+    Examples:
+        >>> combined = compose_patterns([
+        ...     MatchConfig(pattern="ERROR", case_sensitive=False),
+        ...     MatchConfig(pattern="/WARN(ING)?/", case_sensitive=True),
+        ... ])
+        >>> isinstance(combined(Line(1, "WARN: low memory")), Ok)
+        True
+        >>> combined(Line(2, "INFO: ok"))
+        Err('No match (tried 2 patterns)')
+    """
+    if not configs:
+        no_patterns = Err("No matchers provided")
+        return lambda line: no_patterns
+
+    try:
+        line_matchers = [create_multi_literal_matcher(tuple(configs))]
+    except ValueError:
+        line_matchers = [_build_line_matcher(config) for config in configs]
+
+    no_match = Err(f"No match (tried {len(configs)} patterns)")
+
+    def composite(line: Line) -> MatchResult:
+        """Try the unboxed matchers in order, boxing the first match."""
+        for match_line in line_matchers:
+            context = match_line(line)
+
+            if context is not None:
+                return Ok(context)
+
+        # None matched
+        return no_match
+
+    return composite
+
+def _any_needle_in(needles: tuple[str, ...]) -> Callable[[str], bool] | None:
+    """Build a test for whether any needle occurs in a text.
+
+    Below AHO_CORASICK_THRESHOLD needles a loop of C-level substring
+    searches is faster than a regex alternation or an automaton.
+
+    Returns:
+        The test function, or None if there are no needles
+
+    Examples:
+        >>> _any_needle_in(("ERROR", "WARN"))("WARN: low memory")
+        True
+        >>> _any_needle_in(()) is None
+        True
+    """
+    if not needles:
+        return None
+
+    if len(needles) >= AHO_CORASICK_THRESHOLD:
+        try:
+            import ahocorasick
+        except ImportError:
+            pass
+        else:
+            automaton = ahocorasick.Automaton()
+            for needle in needles:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+            iter_hits = automaton.iter
+
+            return lambda text: next(iter_hits(text), None) is not None
+
+    def any_in(text: str) -> bool:
+        """Check the needles one by one, stopping at the first hit."""
+        return any(needle in text for needle in needles)
+
+    return any_in
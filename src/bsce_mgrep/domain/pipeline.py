@@ -4,10 +4,22 @@ This module composes the core processing pipeline: reading → matching → filt
 All stages use Result types for error handling along success/failure tracks.
 """
 
+from collections import Counter
+from itertools import islice
 from typing import Iterator, Callable
 from result import Result, Ok, Err
 
-from bsce_mgrep.domain.types import Line, MatchContext, LineResult, MatchResult, FilterResult
+from bsce_mgrep.domain.filter import no_filter
+from bsce_mgrep.domain.types import (
+    Line, LineBatch, MatchContext, LineResult, MatchResult, FilterResult
+)
+
+# Sinks a fused runner pushes into: matches, and error messages
+type Emit = Callable[[MatchContext], object]
+type Report = Callable[[str], object]
+
+# Number of lines handed to a batch matcher at once
+BATCH_SIZE = 4096
 
 
 def build_pipeline(
@@ -15,104 +27,254 @@ def build_pipeline(
     filter_fn: Callable[[MatchContext], FilterResult],
 ) -> Callable[[Iterator[LineResult]], Iterator[Result[MatchContext, str]]]:
     """Compose the processing pipeline with Railway-Oriented Programming.
-    
+
     Pipeline stages:
         1. Lines (from reader)
         2. Match against pattern
         3. Filter with where clauses
         4. Yield successful matches
-    
+
     Errors at any stage are propagated but don't stop processing of other lines.
-    
+
+    When filter_fn is no_filter (e.g. from create_filter([])), the pipeline
+    is specialized at build time without the filter stage, saving a call
+    and a Result dispatch per match.
+
     Args:
         matcher: Function to match lines against pattern
         filter_fn: Function to apply where clause filters
-        
+
     Returns:
         A function that transforms an iterator of LineResults into MatchContexts
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line
         >>> from bsce_mgrep.domain.matcher import MatchConfig, create_matcher
         >>> from bsce_mgrep.domain.filter import create_filter
-        >>> 
+        >>>
         >>> config = MatchConfig(pattern="ERROR", case_sensitive=False)
         >>> matcher = create_matcher(config)
-        >>> filter_fn = create_filter([])
+        >>> filter_fn = create_filter([]).ok_value
         >>> pipeline = build_pipeline(matcher, filter_fn)
-        >>> 
+        >>>
         >>> lines = [Ok(Line(1, "ERROR: timeout")), Ok(Line(2, "INFO: ok"))]
         >>> results = list(pipeline(iter(lines)))
         >>> len([r for r in results if isinstance(r, Ok)])
         1
     """
+    if filter_fn is no_filter:
+        def unfiltered_pipeline(lines: Iterator[LineResult]) -> Iterator[Result[MatchContext, str]]:
+            """Process lines through the match stage only."""
+            for line_result in lines:
+                if isinstance(line_result, Err):
+                    # Propagate read errors
+                    yield line_result
+                    continue
+
+                match_result = matcher(line_result.ok_value)
+
+                # Misses are skipped silently
+                if type(match_result) is Ok:
+                    yield match_result
+
+        return unfiltered_pipeline
+
     def pipeline(lines: Iterator[LineResult]) -> Iterator[Result[MatchContext, str]]:
         """Process lines through match → filter stages."""
+        # Results are dispatched with type tests (Ok and Err are final
+        # classes) rather than with match statements: one cheap test per
+        # stage instead of a class-pattern match and attribute unpacking
         for line_result in lines:
             # Stage 1: Check if line was read successfully
-            match line_result:
-                case Err(error):
-                    # Propagate read errors
-                    yield Err(error)
-                    continue
-                case Ok(line):
-                    pass
-            
+            if isinstance(line_result, Err):
+                # Propagate read errors
+                yield line_result
+                continue
+
             # Stage 2: Match line against pattern
-            match_result = matcher(line)
-            
-            match match_result:
-                case Err(_):
-                    # Line doesn't match - silently skip
-                    # (this is normal, not an error to report)
-                    continue
-                case Ok(context):
-                    pass
-            
+            # (a match is yielded as this same Ok, not re-boxed)
+            match_result = matcher(line_result.ok_value)
+
+            if type(match_result) is not Ok:
+                # Line doesn't match - silently skip
+                # (this is normal, not an error to report)
+                continue
+
             # Stage 3: Apply where clause filters
-            filter_result = filter_fn(context)
-            
-            match filter_result:
-                case Err(error):
+            filter_result = filter_fn(match_result.ok_value)
+
+            if isinstance(filter_result, Err):
+                # Filter evaluation error - report and skip
+                yield filter_result
+            elif filter_result.ok_value:
+                # All filters passed - yield the match
+                yield match_result
+            # else: filter rejected - silently skip
+
+    return pipeline
+
+
+def build_line_runner(
+    matcher: Callable[[Line], MatchContext | None],
+    predicate: Callable[[MatchContext], bool] | None,
+) -> Callable[[Iterator[Line], Emit, Report], None]:
+    """Fuse match → filter → emit into a single loop.
+
+    Instead of yielding Results to a consumer, the returned runner pushes
+    each passing MatchContext straight into `emit` and each evaluation error
+    message into `report`. Per line this costs the matcher call and nothing
+    else: no generator hand-off and no Result allocation per match.
+
+    Args:
+        matcher: Unboxed matcher (see create_line_matcher)
+        predicate: Unboxed where-clause predicate, or None when there are
+            no where clauses (the loop then skips the filter stage)
+
+    Returns:
+        A function run(lines, emit, report) that consumes all lines
+
+    Examples:
+        >>> from bsce_mgrep.domain.matcher import MatchConfig, create_line_matcher
+        >>>
+        >>> matcher = create_line_matcher(MatchConfig(pattern="ERROR", case_sensitive=False))
+        >>> run = build_line_runner(matcher, None)
+        >>> found = []
+        >>> run(iter([Line(1, "ERROR: timeout"), Line(2, "INFO: ok")]), found.append, print)
+        >>> [ctx.line.number for ctx in found]
+        [1]
+    """
+    if predicate is None:
+        def run_unfiltered(lines: Iterator[Line], emit: Emit, report: Report) -> None:
+            """Emit every matching line."""
+            for line in lines:
+                context = matcher(line)
+
+                if context is not None:
+                    emit(context)
+
+        return run_unfiltered
+
+    def run(lines: Iterator[Line], emit: Emit, report: Report) -> None:
+        """Emit every matching line that passes the predicate."""
+        for line in lines:
+            context = matcher(line)
+
+            if context is None:
+                # Line doesn't match - silently skip
+                continue
+
+            try:
+                passes = predicate(context)
+            except Exception as e:
+                # Filter evaluation error - report and skip
+                report(f"Evaluation error: {e}")
+                continue
+
+            if passes:
+                emit(context)
+
+    return run
+
+
+def iter_batches(lines: Iterator[Line], size: int = BATCH_SIZE) -> Iterator[LineBatch]:
+    """Group lines into LineBatches of up to `size` lines.
+
+    For sources of bare Lines; readers build batches directly from raw
+    blocks (see SourceReader.iter_line_batches).
+
+    Examples:
+        >>> lines = iter([Line(n, "x") for n in range(5)])
+        >>> [batch.numbers for batch in iter_batches(lines, size=2)]
+        [(0, 1), (2, 3), (4,)]
+    """
+    while chunk := list(islice(lines, size)):
+        numbers, contents = zip(*chunk, strict=True)
+        yield LineBatch(numbers, contents)
+
+
+def build_batch_runner(
+    batch_matcher: Callable[[LineBatch], list[MatchContext]],
+    predicate: Callable[[MatchContext], bool] | None,
+) -> Callable[[Iterator[LineBatch], Emit, Report], None]:
+    """Fuse batched match → filter → emit into a single loop.
+
+    Same contract as build_line_runner, but lines arrive and are matched a
+    LineBatch at a time (see create_batch_matcher): the per-line work of
+    the common, non-matching lines happens inside a C-level scan of the
+    whole batch, and only matches reach the Python-level filter and emit
+    stages.
+
+    Args:
+        batch_matcher: Batch matcher (see create_batch_matcher)
+        predicate: Unboxed where-clause predicate, or None when there are
+            no where clauses
+
+    Returns:
+        A function run(batches, emit, report) that consumes all batches
+
+    Examples:
+        >>> from bsce_mgrep.domain.matcher import MatchConfig, create_batch_matcher
+        >>>
+        >>> matcher = create_batch_matcher(MatchConfig(pattern="ERROR", case_sensitive=False))
+        >>> run = build_batch_runner(matcher, lambda ctx: ctx.line.length > 5)
+        >>> found = []
+        >>> batch = LineBatch(range(1, 4), ["ERROR: timeout", "error", "INFO"])
+        >>> run(iter([batch]), found.append, print)
+        >>> [ctx.line.number for ctx in found]
+        [1]
+    """
+    if predicate is None:
+        def run_unfiltered(batches: Iterator[LineBatch], emit: Emit, report: Report) -> None:
+            """Emit every match of every batch."""
+            for batch in batches:
+                for context in batch_matcher(batch):
+                    emit(context)
+
+        return run_unfiltered
+
+    def run(batches: Iterator[LineBatch], emit: Emit, report: Report) -> None:
+        """Emit every match of every batch that passes the predicate."""
+        for batch in batches:
+            for context in batch_matcher(batch):
+                try:
+                    passes = predicate(context)
+                except Exception as e:
                     # Filter evaluation error - report and skip
-                    yield Err(error)
+                    report(f"Evaluation error: {e}")
                     continue
-                case Ok(passes):
-                    if passes:
-                        # All filters passed - yield the match
-                        yield Ok(context)
-                    # else: filter rejected - silently skip
-    
-    return pipeline
+
+                if passes:
+                    emit(context)
+
+    return run
 
 
 def build_simple_pipeline(
     matcher: Callable[[Line], MatchResult],
 ) -> Callable[[Iterator[LineResult]], Iterator[MatchContext]]:
     """Build a pipeline with only matching (no filtering).
-    
+
     Convenience function for pipelines that don't need where clauses.
-    
+
     Args:
         matcher: Function to match lines against pattern
-        
+
     Returns:
         A pipeline function without filtering stage
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line
         >>> from bsce_mgrep.domain.matcher import MatchConfig, create_matcher
-        >>> 
+        >>>
         >>> config = MatchConfig(pattern="ERROR", case_sensitive=False)
         >>> matcher = create_matcher(config)
         >>> pipeline = build_simple_pipeline(matcher)
-        >>> 
+        >>>
         >>> lines = [Ok(Line(1, "ERROR: timeout"))]
         >>> results = list(pipeline(iter(lines)))
         >>> len(results)
         1
     """
-    no_filter: Callable[[MatchContext], FilterResult] = lambda ctx: Ok(True)
     return build_pipeline(matcher, no_filter)
 
 
@@ -120,63 +282,62 @@ def compose_matchers(
     matchers: list[Callable[[Line], MatchResult]]
 ) -> Callable[[Line], MatchResult]:
     """Compose multiple matchers with OR logic.
-    
+
     Returns the first successful match, or Err if none match.
-    
+
     Args:
         matchers: List of matcher functions
-        
+
     Returns:
         A composite matcher that tries all matchers
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line
         >>> from bsce_mgrep.domain.matcher import MatchConfig, create_matcher
-        >>> 
+        >>>
         >>> config1 = MatchConfig(pattern="ERROR", case_sensitive=False)
         >>> config2 = MatchConfig(pattern="WARN", case_sensitive=False)
         >>> matcher1 = create_matcher(config1)
         >>> matcher2 = create_matcher(config2)
         >>> combined = compose_matchers([matcher1, matcher2])
-        >>> 
+        >>>
         >>> line = Line(1, "WARN: low memory")
         >>> result = combined(line)
         >>> isinstance(result, Ok)
         True
     """
     if not matchers:
-        return lambda line: Err("No matchers provided")
-    
+        no_matchers = Err("No matchers provided")
+        return lambda line: no_matchers
+
+    no_match = Err(f"No match (tried {len(matchers)} patterns)")
+
     def composite(line: Line) -> MatchResult:
         """Try all matchers until one succeeds."""
-        errors = []
-        
         for matcher in matchers:
             result = matcher(line)
-            
-            match result:
-                case Ok(_):
-                    return result
-                case Err(error):
-                    errors.append(error)
-        
+
+            if type(result) is Ok:
+                return result
+
         # None matched
-        return Err(f"No match (tried {len(matchers)} patterns)")
-    
+        return no_match
+
     return composite
 
 
 def count_results(results: Iterator[Result[MatchContext, str]]) -> tuple[int, int]:
     """Count successes and errors in a result stream.
-    
+
     Consumes the iterator and returns counts. Useful for statistics.
-    
+    The iterator is drained by C code, with no interpreted work per result.
+
     Args:
         results: Iterator of Results to count
-        
+
     Returns:
         Tuple of (success_count, error_count)
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line, MatchContext
         >>> line = Line(1, "test")
@@ -185,14 +346,7 @@ def count_results(results: Iterator[Result[MatchContext, str]]) -> tuple[int, in
         >>> count_results(iter(results))
         (2, 1)
     """
-    success_count = 0
-    error_count = 0
-    
-    for result in results:
-        match result:
-            case Ok(_):
-                success_count += 1
-            case Err(_):
-                error_count += 1
-    
-    return success_count, error_count
+    # Ok and Err are final classes: tallying exact types runs the whole
+    # loop in C (Counter's counting helper) instead of one match per result
+    counts = Counter(map(type, results))
+    return counts[Ok], counts[Err]
@@ -4,8 +4,10 @@ This module defines the core domain types used throughout the application.
 All types are immutable and represent pure domain concepts.
 """
 
-from dataclasses import dataclass
-from result import Result
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import NamedTuple
+from result import Result, Ok, Err
 
 # Type aliases using Python 3.12 syntax
 type LineNumber = int
@@ -14,14 +16,17 @@ type PatternString = str
 type FilterExpression = str
 type ErrorMessage = str
 
-@dataclass(frozen=True, slots=True)
-class Line:
+class Line(NamedTuple):
     """Represents a single line from input source.
-    
+
+    A NamedTuple rather than a frozen dataclass: one Line is built per input
+    line, and tuple construction skips the dataclass __init__ frame and its
+    per-field object.__setattr__ calls.
+
     Attributes:
         number: 1-indexed line number in the source
         content: Raw line content (without trailing newline)
-    
+
     Examples:
         >>> line = Line(number=1, content="ERROR: Database timeout")
         >>> line.length
@@ -31,72 +36,99 @@ class Line:
     """
     number: LineNumber
     content: LineContent
-    
+
     @property
     def length(self) -> int:
         """Character count of line content.
-        
+
         Returns:
             Number of characters in the content string
         """
         return len(self.content)
-    
+
     def contains(self, text: str) -> bool:
         """Check if line contains substring.
-        
+
         Args:
             text: Substring to search for
-            
+
         Returns:
             True if text is found in content
-            
+
         Examples:
             >>> Line(1, "ERROR: timeout").contains("ERROR")
             True
         """
         return text in self.content
-    
+
     def startswith(self, text: str) -> bool:
         """Check if line starts with substring.
-        
+
         Args:
             text: Prefix to search for
-            
+
         Returns:
             True if content starts with text
-            
+
         Examples:
             >>> Line(1, "ERROR: timeout").startswith("ERROR")
             True
         """
         return self.content.startswith(text)
-    
+
     def endswith(self, text: str) -> bool:
         """Check if line ends with substring.
-        
+
         Args:
             text: Suffix to search for
-            
+
         Returns:
             True if content ends with text
-            
+
         Examples:
             >>> Line(1, "status=500").endswith("500")
             True
         """
         return self.content.endswith(text)
 
-@dataclass(frozen=True, slots=True)
-class MatchContext:
+class LineBatch(NamedTuple):
+    """A run of input lines stored as parallel sequences.
+
+    Batch matchers scan many lines per call and only need the Line of a
+    matching one, so batches keep numbers and contents apart (structure of
+    arrays) instead of holding one Line object per input line. For
+    consecutive lines, numbers is a range and costs nothing per line.
+
+    Attributes:
+        numbers: Line number of each line
+        contents: Content of each line, in the same order
+
+    Examples:
+        >>> batch = LineBatch(range(7, 9), ["INFO: ok", "ERROR: timeout"])
+        >>> batch.line(1)
+        Line(number=8, content='ERROR: timeout')
+    """
+    numbers: Sequence[LineNumber]
+    contents: Sequence[LineContent]
+
+    def line(self, index: int) -> Line:
+        """Materialize the Line at a position of the batch."""
+        return Line(self.numbers[index], self.contents[index])
+
+class MatchContext(NamedTuple):
     """Context available during filtering.
-    
+
     Combines matched line with any captured regex groups for use in
     where clause evaluation.
-    
+
+    A NamedTuple like Line: one MatchContext is built per matching line,
+    and tuple construction is several times cheaper than the frozen
+    dataclass __init__.
+
     Attributes:
         line: The matched Line object
-        groups: Dictionary of named regex capture groups
-        
+        groups: Mapping of named regex capture groups
+
     Examples:
         >>> line = Line(1, "status=500")
         >>> ctx = MatchContext(line=line, groups={"code": "500"})
@@ -104,9 +136,21 @@ class MatchContext:
         '500'
     """
     line: Line
-    groups: dict[str, str]
+    groups: Mapping[str, str]
 
 # Result types for Railway-Oriented Programming
 type LineResult = Result[Line, ErrorMessage]
 type MatchResult = Result[MatchContext, ErrorMessage]
 type FilterResult = Result[bool, ErrorMessage]
+
+# Shared filter and match outcomes. Results are immutable values, so boxed
+# filters and matchers return these instead of allocating a new Result for
+# every line.
+FILTER_PASS: FilterResult = Ok(True)
+FILTER_REJECT: FilterResult = Ok(False)
+NO_MATCH: MatchResult = Err("No match")
+
+# Groups of every match without named groups (literals, and regexes that
+# define none). Shared to save a dict per match, and read-only so no
+# consumer can leak groups into other matches.
+NO_GROUPS: Mapping[str, str] = MappingProxyType({})
@@ -10,17 +10,23 @@ Grammar:
     cmp_expr := term (('>' | '<' | '>=' | '<=' | '==' | '!=') term)?
     term     := 'not' term | atom
     atom     := NUMBER | STRING | attribute | method_call | group_call | '(' expr ')'
-    
+
     attribute    := 'line' '.' IDENT
     method_call  := 'line' '.' IDENT '(' STRING ')'
     group_call   := 'group' '(' STRING ')'
 """
 
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, NamedTuple, cast
 from result import Result, Ok, Err
+import operator
 import re
 
-from bsce_mgrep.domain.types import MatchContext, FilterResult, FilterExpression
+from bsce_mgrep.domain.types import Line, MatchContext, FilterResult, FilterExpression
+from bsce_mgrep.utils.config import CACHE_SIZE
 
 
 # AST Node types
@@ -42,7 +48,7 @@ class MethodCall:
     """Method call (e.g., line.contains("text"))."""
     object: str      # e.g., "line"
     method: str      # e.g., "contains"
-    args: list[str]  # e.g., ["text"]
+    args: tuple[str, ...]  # e.g., ("text",)
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,34 +75,32 @@ class UnaryOp:
 type ASTNode = Literal | Attribute | MethodCall | GroupAccess | BinaryOp | UnaryOp
 
 
-# Token types
-TOKEN_PATTERNS = [
-    ('NUMBER', r'-?\d+'),
-    ('STRING', r'"([^"\\]|\\.)*"|\'([^\'\\]|\\.)*\''),
-    ('GTE', r'>='),
-    ('LTE', r'<='),
-    ('EQ', r'=='),
-    ('NEQ', r'!='),
-    ('GT', r'>'),
-    ('LT', r'<'),
-    ('AND', r'\band\b'),
-    ('OR', r'\bor\b'),
-    ('NOT', r'\bnot\b'),
-    ('IDENT', r'[a-zA-Z_][a-zA-Z0-9_]*'),
-    ('LPAREN', r'\('),
-    ('RPAREN', r'\)'),
-    ('DOT', r'\.'),
-    ('COMMA', r','),
-    ('WHITESPACE', r'\s+'),
-]
-
-TOKEN_REGEX = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_PATTERNS)
-TOKEN_RE = re.compile(TOKEN_REGEX)
+# Token types produced by the scanner
+KEYWORDS = {'and': 'AND', 'or': 'OR', 'not': 'NOT'}
+OPERATORS = {'>=': 'GTE', '<=': 'LTE', '==': 'EQ', '!=': 'NEQ', '>': 'GT', '<': 'LT'}
+PUNCTUATION = {'(': 'LPAREN', ')': 'RPAREN', '.': 'DOT', ',': 'COMMA'}
 
+# Characters that may start and continue an identifier (ASCII only)
+IDENT_START = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+IDENT_CHARS = IDENT_START | frozenset('0123456789')
 
-@dataclass(frozen=True, slots=True)
-class Token:
-    """A lexical token."""
+# Backslash escapes in string literals and the characters they stand for
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {'\\': '\\', '"': '"', "'": "'", 'n': '\n', 't': '\t', 'r': '\r'}
+
+# Members of `line` accepted by the parser; the interpreter and the code
+# generator only ever see these names
+LINE_ATTRIBUTES = frozenset(('length', 'number', 'content'))
+LINE_METHODS = frozenset(('contains', 'startswith', 'endswith'))
+
+
+class Token(NamedTuple):
+    """A lexical token.
+
+    A NamedTuple like Line: tokenize builds one per token, and tuple
+    construction skips the per-field object.__setattr__ calls of a frozen
+    dataclass.
+    """
     type: str
     value: str
     position: int
@@ -104,226 +108,316 @@ class Token:
 
 def tokenize(expression: str) -> Result[list[Token], str]:
     """Tokenize an expression into a list of tokens.
-    
+
+    A hand-written scanner: the first character of each token selects the
+    branch that scans it, so no alternation of token patterns is tried per
+    token. Tokens:
+    - NUMBER: optional "-" followed by decimal digits
+    - STRING: text in double or single quotes, with backslash escapes
+    - GTE, LTE, EQ, NEQ, GT, LT: comparison operators
+    - AND, OR, NOT: keywords; IDENT: other ASCII identifiers
+    - LPAREN, RPAREN, DOT, COMMA: punctuation
+    Whitespace between tokens is skipped.
+
     Args:
         expression: Filter expression string
-        
+
     Returns:
         Result containing list of tokens or error message
-        
+
     Examples:
         >>> result = tokenize("line.length > 120")
         >>> len(result.ok_value)
         5
+        >>> tokenize("line.length @ 120")
+        Err('Unexpected character at position 12: @')
     """
     tokens: list[Token] = []
+    append = tokens.append
     position = 0
-    
-    for match in TOKEN_RE.finditer(expression):
-        token_type = match.lastgroup
-        token_value = match.group()
-        
-        if token_type == 'WHITESPACE':
-            # Skip whitespace
+    size = len(expression)
+
+    while position < size:
+        char = expression[position]
+        start = position
+
+        if char.isspace():
+            position += 1
             continue
-        
-        if token_type is None:
-            return Err(f"Invalid character at position {match.start()}: {token_value}")
-        
-        tokens.append(Token(type=token_type, value=token_value, position=match.start()))
-        position = match.end()
-    
-    if position < len(expression):
-        return Err(f"Unexpected character at position {position}: {expression[position]}")
-    
+
+        if char.isdecimal() or (char == '-' and expression[position + 1:position + 2].isdecimal()):
+            position += 1
+            while position < size and expression[position].isdecimal():
+                position += 1
+            append(Token('NUMBER', expression[start:position], start))
+
+        elif char in IDENT_START:
+            position += 1
+            while position < size and expression[position] in IDENT_CHARS:
+                position += 1
+            word = expression[start:position]
+            append(Token(KEYWORDS.get(word, 'IDENT'), word, start))
+
+        elif char == '"' or char == "'":
+            # Scan to the closing quote; a backslash escapes any character
+            # but a newline
+            position += 1
+            while position < size and expression[position] != char:
+                if expression[position] == '\\':
+                    position += 1
+                    if position < size and expression[position] == '\n':
+                        break
+                position += 1
+            if position >= size or expression[position] != char:
+                return Err(f"Unterminated string at position {start}")
+            position += 1
+            append(Token('STRING', expression[start:position], start))
+
+        elif (operator := expression[position:position + 2]) in OPERATORS:
+            position += 2
+            append(Token(OPERATORS[operator], operator, start))
+
+        elif char in OPERATORS:
+            position += 1
+            append(Token(OPERATORS[char], char, start))
+
+        elif char in PUNCTUATION:
+            position += 1
+            append(Token(PUNCTUATION[char], char, start))
+
+        else:
+            return Err(f"Unexpected character at position {position}: {char}")
+
     return Ok(tokens)
 
 
 class Parser:
     """Recursive descent parser for filter expressions."""
-    
+
     def __init__(self, tokens: list[Token]):
         self.tokens = tokens
         self.position = 0
-    
+
     def current_token(self) -> Token | None:
         """Get current token without consuming."""
         if self.position < len(self.tokens):
             return self.tokens[self.position]
         return None
-    
+
+    def at(self, token_type: str) -> bool:
+        """Check whether the current token has the given type."""
+        token = self.current_token()
+        return token is not None and token.type == token_type
+
     def consume(self, expected_type: str | None = None) -> Token:
         """Consume and return current token."""
         token = self.current_token()
         if token is None:
             raise ValueError("Unexpected end of expression")
-        
+
         if expected_type and token.type != expected_type:
-            raise ValueError(f"Expected {expected_type}, got {token.type} at position {token.position}")
-        
+            raise ValueError(
+                f"Expected {expected_type}, got {token.type} at position {token.position}"
+            )
+
         self.position += 1
         return token
-    
+
     def parse(self) -> Result[ASTNode, str]:
         """Parse tokens into AST."""
         try:
             ast = self.parse_or_expr()
-            if self.current_token() is not None:
-                return Err(f"Unexpected token after expression: {self.current_token().value}")
+            if (token := self.current_token()) is not None:
+                return Err(f"Unexpected token after expression: {token.value}")
             return Ok(ast)
         except ValueError as e:
             return Err(str(e))
         except Exception as e:
             return Err(f"Parse error: {e}")
-    
+
     def parse_or_expr(self) -> ASTNode:
         """Parse: or_expr := and_expr ('or' and_expr)*"""
         left = self.parse_and_expr()
-        
-        while self.current_token() and self.current_token().type == 'OR':
+
+        while self.at('OR'):
             self.consume('OR')
             right = self.parse_and_expr()
             left = BinaryOp(left=left, op='or', right=right)
-        
+
         return left
-    
+
     def parse_and_expr(self) -> ASTNode:
         """Parse: and_expr := cmp_expr ('and' cmp_expr)*"""
         left = self.parse_cmp_expr()
-        
-        while self.current_token() and self.current_token().type == 'AND':
+
+        while self.at('AND'):
             self.consume('AND')
             right = self.parse_cmp_expr()
             left = BinaryOp(left=left, op='and', right=right)
-        
+
         return left
-    
+
     def parse_cmp_expr(self) -> ASTNode:
         """Parse: cmp_expr := term (('>' | '<' | '>=' | '<=' | '==' | '!=') term)?"""
         left = self.parse_term()
-        
+
         token = self.current_token()
         if token and token.type in ('GT', 'LT', 'GTE', 'LTE', 'EQ', 'NEQ'):
             op_token = self.consume()
             right = self.parse_term()
-            
+
             # Map token type to operator string
             op_map = {
                 'GT': '>', 'LT': '<', 'GTE': '>=',
                 'LTE': '<=', 'EQ': '==', 'NEQ': '!='
             }
             return BinaryOp(left=left, op=op_map[op_token.type], right=right)
-        
+
         return left
-    
+
     def parse_term(self) -> ASTNode:
         """Parse: term := 'not' term | atom"""
         token = self.current_token()
-        
+
         if token and token.type == 'NOT':
             self.consume('NOT')
             operand = self.parse_term()
             return UnaryOp(op='not', operand=operand)
-        
+
         return self.parse_atom()
-    
+
     def parse_atom(self) -> ASTNode:
         """Parse: atom := NUMBER | STRING | attribute | method_call | group_call | '(' expr ')'"""
         token = self.current_token()
-        
+
         if not token:
             raise ValueError("Unexpected end of expression")
-        
+
         # Parenthesized expression
         if token.type == 'LPAREN':
             self.consume('LPAREN')
             expr = self.parse_or_expr()
             self.consume('RPAREN')
             return expr
-        
+
         # Number literal
         if token.type == 'NUMBER':
             self.consume('NUMBER')
             return Literal(value=int(token.value))
-        
+
         # String literal
         if token.type == 'STRING':
             self.consume('STRING')
-            # Remove quotes and handle escapes
-            string_value = token.value[1:-1]  # Remove surrounding quotes
-            string_value = string_value.replace(r'\"', '"').replace(r"\'", "'")
-            return Literal(value=string_value)
-        
+            return Literal(value=_string_value(token))
+
         # Identifier (could be attribute access, method call, or group call)
         if token.type == 'IDENT':
             ident = self.consume('IDENT').value
-            
+
             # Check for dot notation (line.attr or line.method(...))
-            if self.current_token() and self.current_token().type == 'DOT':
+            if self.at('DOT'):
                 self.consume('DOT')
                 member = self.consume('IDENT').value
-                
+
                 # Check if it's a method call
-                if self.current_token() and self.current_token().type == 'LPAREN':
+                if self.at('LPAREN'):
                     self.consume('LPAREN')
                     args = []
-                    
+
                     # Parse method arguments
-                    if self.current_token() and self.current_token().type == 'STRING':
-                        arg_token = self.consume('STRING')
-                        arg_value = arg_token.value[1:-1]
-                        arg_value = arg_value.replace(r'\"', '"').replace(r"\'", "'")
-                        args.append(arg_value)
-                    
+                    if self.at('STRING'):
+                        args.append(_string_value(self.consume('STRING')))
+
                     self.consume('RPAREN')
-                    return MethodCall(object=ident, method=member, args=args)
+                    _check_member(ident, member, LINE_METHODS, "method")
+                    if len(args) != 1:
+                        raise ValueError(f"{member}() requires exactly 1 argument")
+                    return MethodCall(object=ident, method=member, args=tuple(args))
                 else:
                     # Attribute access
+                    _check_member(ident, member, LINE_ATTRIBUTES, "attribute")
                     return Attribute(object=ident, attr=member)
-            
+
             # Check for function call (group(...))
-            if self.current_token() and self.current_token().type == 'LPAREN':
+            if self.at('LPAREN'):
                 self.consume('LPAREN')
-                
+
                 if ident == 'group':
                     # Parse group name
-                    if self.current_token() and self.current_token().type == 'STRING':
-                        name_token = self.consume('STRING')
-                        name_value = name_token.value[1:-1]
-                        name_value = name_value.replace(r'\"', '"').replace(r"\'", "'")
+                    if self.at('STRING'):
+                        name_value = _string_value(self.consume('STRING'))
                         self.consume('RPAREN')
                         return GroupAccess(name=name_value)
                     else:
                         raise ValueError(f"group() requires string argument")
                 else:
                     raise ValueError(f"Unknown function: {ident}")
-            
+
             raise ValueError(f"Unexpected identifier: {ident}")
-        
+
         raise ValueError(f"Unexpected token: {token.type}")
 
 
+def _string_value(token: Token) -> str:
+    """Strip the quotes of a STRING token and resolve its escapes in one pass.
+
+    \\\\, \\", \\', \\n, \\t and \\r stand for the character they name; any
+    other backslash is kept as is, as in Python string literals.
+
+    Examples:
+        >>> _string_value(Token('STRING', r'"C:\\\\dir\\d+ \\"x\\"\\t"', 0))
+        'C:\\\\dir\\\\d+ "x"\\t'
+    """
+    body = token.value[1:-1]
+    if '\\' not in body:
+        return body
+    return _ESCAPE.sub(lambda escape: _ESCAPES.get(escape[1], escape[0]), body)
+
+
+def _check_member(obj: str, member: str, allowed: frozenset[str], kind: str) -> None:
+    """Reject unknown objects and members while parsing, not per line.
+
+    Raises:
+        ValueError: With the evaluator's message for the same mistake
+    """
+    if obj != 'line':
+        raise ValueError(f"Unknown object: {obj}")
+    if member not in allowed:
+        raise ValueError(f"Unknown line {kind}: {member}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_where_expression(expr: FilterExpression) -> Result[ASTNode, str]:
     """Parse a where expression into an AST.
-    
+
+    Parsing is pure and ASTs are immutable, so results are memoized per
+    expression string: an expression shared by several clause lists (see
+    create_predicate) is tokenized and parsed once.
+
+    Unknown objects, line attributes and line methods, and method calls
+    with the wrong number of arguments are parse errors, so a mistyped
+    clause fails once up front instead of on every evaluated line.
+
     Args:
         expr: Filter expression string
-        
+
     Returns:
         Result containing AST or error message
-        
+
     Examples:
         >>> result = parse_where_expression("line.length > 120")
         >>> isinstance(result, Ok)
         True
+        >>> parse_where_expression("line.size > 120")
+        Err('Unknown line attribute: size')
     """
     # Tokenize
     tokens_result = tokenize(expr)
     if isinstance(tokens_result, Err):
         return tokens_result
-    
+
     tokens = tokens_result.ok_value
-    
+
     # Parse
     parser = Parser(tokens)
     return parser.parse()
@@ -331,14 +425,14 @@ def parse_where_expression(expr: FilterExpression) -> Result[ASTNode, str]:
 
 def evaluate_where(ast: ASTNode, context: MatchContext) -> FilterResult:
     """Evaluate AST with match context.
-    
+
     Args:
         ast: Abstract syntax tree to evaluate
         context: Match context with line and groups
-        
+
     Returns:
         Result containing boolean or error message
-        
+
     Examples:
         >>> from bsce_mgrep.domain.types import Line
         >>> line = Line(1, "test")
@@ -349,91 +443,260 @@ def evaluate_where(ast: ASTNode, context: MatchContext) -> FilterResult:
         True
     """
     try:
-        result = _evaluate_node(ast, context)
-        return Ok(result)
+        return Ok(bool(_evaluate_node(ast, context)))
     except Exception as e:
         return Err(f"Evaluation error: {e}")
 
 
+# Interpreter dispatch tables: a name resolves to its implementation with one
+# dict lookup instead of a chain of string comparisons per evaluated node
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+_LINE_GETTERS: dict[str, Callable[[Line], int | str]] = {
+    'length': operator.attrgetter('length'),
+    'number': operator.attrgetter('number'),
+    'content': operator.attrgetter('content'),
+}
+
+
 def _evaluate_node(node: ASTNode, context: MatchContext) -> bool | int | str:
     """Recursively evaluate AST node."""
     match node:
         case Literal(value):
             return value
-        
+
         case Attribute(obj, attr):
-            if obj == 'line':
-                line = context.line
-                match attr:
-                    case 'length':
-                        return line.length
-                    case 'number':
-                        return line.number
-                    case 'content':
-                        return line.content
-                    case _:
-                        raise ValueError(f"Unknown line attribute: {attr}")
-            else:
+            if obj != 'line':
                 raise ValueError(f"Unknown object: {obj}")
-        
+
+            getter = _LINE_GETTERS.get(attr)
+            if getter is None:
+                raise ValueError(f"Unknown line attribute: {attr}")
+            return getter(context.line)
+
         case MethodCall(obj, method, args):
-            if obj == 'line':
-                line = context.line
-                match method:
-                    case 'contains':
-                        if len(args) != 1:
-                            raise ValueError("contains() requires exactly 1 argument")
-                        return line.contains(args[0])
-                    case 'startswith':
-                        if len(args) != 1:
-                            raise ValueError("startswith() requires exactly 1 argument")
-                        return line.startswith(args[0])
-                    case 'endswith':
-                        if len(args) != 1:
-                            raise ValueError("endswith() requires exactly 1 argument")
-                        return line.endswith(args[0])
-                    case _:
-                        raise ValueError(f"Unknown line method: {method}")
-            else:
+            if obj != 'line':
                 raise ValueError(f"Unknown object: {obj}")
-        
+            if method not in LINE_METHODS:
+                raise ValueError(f"Unknown line method: {method}")
+            if len(args) != 1:
+                raise ValueError(f"{method}() requires exactly 1 argument")
+            return bool(getattr(context.line, method)(args[0]))
+
         case GroupAccess(name):
             if name in context.groups:
                 return context.groups[name]
             else:
                 raise ValueError(f"Regex group not found: {name}")
-        
+
         case BinaryOp(left, op, right):
-            left_val = _evaluate_node(left, context)
-            right_val = _evaluate_node(right, context)
-            
-            match op:
-                case '>':
-                    return left_val > right_val
-                case '<':
-                    return left_val < right_val
-                case '>=':
-                    return left_val >= right_val
-                case '<=':
-                    return left_val <= right_val
-                case '==':
-                    return left_val == right_val
-                case '!=':
-                    return left_val != right_val
-                case 'and':
-                    return bool(left_val) and bool(right_val)
-                case 'or':
-                    return bool(left_val) or bool(right_val)
-                case _:
-                    raise ValueError(f"Unknown binary operator: {op}")
-        
+            # Short-circuit like the compiled predicate: the right operand
+            # (and any error it would raise) is skipped once the left decides
+            if op == 'and':
+                return bool(_evaluate_node(left, context)) and bool(_evaluate_node(right, context))
+            if op == 'or':
+                return bool(_evaluate_node(left, context)) or bool(_evaluate_node(right, context))
+
+            compare = _COMPARISONS.get(op)
+            if compare is None:
+                raise ValueError(f"Unknown binary operator: {op}")
+            return compare(_evaluate_node(left, context), _evaluate_node(right, context))
+
         case UnaryOp(op, operand):
             operand_val = _evaluate_node(operand, context)
-            match op:
-                case 'not':
-                    return not bool(operand_val)
-                case _:
-                    raise ValueError(f"Unknown unary operator: {op}")
-        
+            if op == 'not':
+                return not bool(operand_val)
+            raise ValueError(f"Unknown unary operator: {op}")
+
         case _:
             raise ValueError(f"Unknown AST node type: {type(node)}")
+
+
+# Code generation: AST → single Python function
+
+# Inlined equivalents of the Line attributes and methods. MatchContext and
+# Line are NamedTuples, so ctx[0] is the line, [0] its number and [1] its
+# content: indexing skips the property and method calls of the Line API.
+_LINE_ATTRIBUTE_SOURCE = {
+    'length': "len(ctx[0][1])",
+    'number': "ctx[0][0]",
+    'content': "ctx[0][1]",
+}
+_LINE_METHOD_SOURCE = {
+    'contains': "({arg!r} in ctx[0][1])",
+    'startswith': "ctx[0][1].startswith({arg!r})",
+    'endswith': "ctx[0][1].endswith({arg!r})",
+}
+COMPARISON_OPERATORS = ('>', '<', '>=', '<=', '==', '!=')
+LOGICAL_OPERATORS = ('and', 'or')
+
+
+# Value of a shared subexpression not evaluated yet in the current call
+_UNSET = object()
+
+
+def to_source(node: ASTNode, shared: dict[ASTNode, str] | None = None) -> str:
+    """Translate an AST into an equivalent Python expression over `ctx`.
+
+    Only whitelisted attributes, methods and operators are emitted and
+    string literals go through repr(), so no user text ever reaches the
+    generated code as a name. Line attributes and methods are inlined
+    (see _LINE_ATTRIBUTE_SOURCE) and groups are read by direct subscript,
+    so the expression makes no Python-level call for them. A missing group
+    raises KeyError; compile_predicate reports it as ValueError.
+
+    Subexpressions listed in `shared` are evaluated at most once per call:
+    each occurrence reads the named local, computing and storing it first
+    if it is still _unset. Occurrences skipped by short-circuiting stay
+    lazy.
+
+    Args:
+        node: AST to translate
+        shared: Subexpression → local variable name (see _shared_subexpressions)
+
+    Returns:
+        Python expression source evaluating the node against `ctx`
+
+    Raises:
+        ValueError: If the AST references an unknown object, attribute,
+            method or operator
+
+    Examples:
+        >>> to_source(BinaryOp(Attribute("line", "length"), ">", Literal(80)))
+        '(len(ctx[0][1]) > 80)'
+        >>> to_source(GroupAccess("code"), {GroupAccess("code"): "_shared0"})
+        "(_shared0 if _shared0 is not _unset else (_shared0 := ctx[1]['code']))"
+    """
+    if shared and node in shared:
+        name = shared[node]
+        return f"({name} if {name} is not _unset else ({name} := {_node_source(node, shared)}))"
+    return _node_source(node, shared)
+
+
+def _node_source(node: ASTNode, shared: dict[ASTNode, str] | None) -> str:
+    """Translate one AST node, its children through to_source."""
+    match node:
+        case Literal(value):
+            return repr(value)
+
+        case Attribute(obj, attr):
+            if obj != 'line':
+                raise ValueError(f"Unknown object: {obj}")
+            if attr not in LINE_ATTRIBUTES:
+                raise ValueError(f"Unknown line attribute: {attr}")
+            return _LINE_ATTRIBUTE_SOURCE[attr]
+
+        case MethodCall(obj, method, args):
+            if obj != 'line':
+                raise ValueError(f"Unknown object: {obj}")
+            if method not in LINE_METHODS:
+                raise ValueError(f"Unknown line method: {method}")
+            if len(args) != 1:
+                raise ValueError(f"{method}() requires exactly 1 argument")
+            return _LINE_METHOD_SOURCE[method].format(arg=args[0])
+
+        case GroupAccess(name):
+            return f"ctx[1][{name!r}]"
+
+        case BinaryOp(left, op, right) if op in COMPARISON_OPERATORS:
+            return f"({to_source(left, shared)} {op} {to_source(right, shared)})"
+
+        case BinaryOp(left, op, right) if op in LOGICAL_OPERATORS:
+            return f"(bool({to_source(left, shared)}) {op} bool({to_source(right, shared)}))"
+
+        case BinaryOp(_, op, _):
+            raise ValueError(f"Unknown binary operator: {op}")
+
+        case UnaryOp('not', operand):
+            return f"(not {to_source(operand, shared)})"
+
+        case UnaryOp(op, _):
+            raise ValueError(f"Unknown unary operator: {op}")
+
+        case _:
+            raise ValueError(f"Unknown AST node type: {type(node)}")
+
+
+def compile_predicate(asts: list[ASTNode]) -> Callable[[MatchContext], bool]:
+    """Fuse several ASTs (AND logic) into one compiled Python function.
+
+    The generated function evaluates every clause in a single frame with
+    short-circuiting, instead of walking each AST per line. Evaluation
+    errors (type mismatches, missing groups) are raised, not returned.
+    Method calls, group lookups and comparisons that occur more than once
+    across the clauses are computed at most once per call.
+
+    Args:
+        asts: Parsed where clauses to combine
+
+    Returns:
+        A predicate MatchContext → bool
+
+    Raises:
+        ValueError: If any AST cannot be translated (see to_source)
+
+    Examples:
+        >>> from bsce_mgrep.domain.types import Line
+        >>> pred = compile_predicate([BinaryOp(Attribute("line", "length"), ">", Literal(3))])
+        >>> pred(MatchContext(line=Line(1, "ERROR"), groups={}))
+        True
+    """
+    shared = _shared_subexpressions(asts)
+    body = " and ".join(f"({to_source(ast, shared)})" for ast in asts) or "True"
+    preamble = "".join(f"    {name} = _unset\n" for name in shared.values())
+    # Group subscripts are the only source of KeyError in the body
+    source = (
+        f"def _pred(ctx):\n{preamble}"
+        f"    try:\n        return bool({body})\n"
+        f"    except KeyError as error:\n        raise _missing_group(error) from None\n"
+    )
+
+    # Minimal namespace: the emitter only references these names
+    namespace: dict[str, Any] = {
+        '__builtins__': {}, 'bool': bool, 'len': len, 'KeyError': KeyError,
+        '_missing_group': _missing_group, '_unset': _UNSET
+    }
+    exec(compile(source, '<where>', 'exec'), namespace)
+    return cast(Callable[[MatchContext], bool], namespace['_pred'])
+
+
+def _shared_subexpressions(asts: list[ASTNode]) -> dict[ASTNode, str]:
+    """Name the costly subexpressions that occur more than once in the ASTs.
+
+    AST nodes are frozen dataclasses, so equal subtrees hash alike wherever
+    they occur. Literals and line attributes are cheaper to recompute than
+    to memoize and are never shared.
+
+    Examples:
+        >>> contains = MethodCall("line", "contains", ("timeout",))
+        >>> _shared_subexpressions([contains, UnaryOp("not", contains)])
+        {MethodCall(object='line', method='contains', args=('timeout',)): '_shared0'}
+    """
+    counts: Counter[ASTNode] = Counter()
+    pending = list(asts)
+
+    while pending:
+        node = pending.pop()
+        match node:
+            case MethodCall() | GroupAccess():
+                counts[node] += 1
+            case BinaryOp(left, op, right):
+                if op in COMPARISON_OPERATORS:
+                    counts[node] += 1
+                pending += (left, right)
+            case UnaryOp(_, operand):
+                pending.append(operand)
+
+    repeated = [node for node, count in counts.items() if count > 1]
+    return {node: f"_shared{index}" for index, node in enumerate(repeated)}
+
+
+def _missing_group(error: KeyError) -> ValueError:
+    """Turn a failed group subscript into the evaluator's error."""
+    return ValueError(f"Regex group not found: {error.args[0]}")
@@ -5,39 +5,94 @@ Adapters implement this protocol for specific input sources (file, stdin, etc.).
 """
 
 from typing import Protocol, Iterator
+from result import Result
 
-from bsce_mgrep.domain.types import LineResult
+from bsce_mgrep.domain.types import Line, LineBatch, LineResult
 
 class SourceReader(Protocol):
     """Protocol for reading lines from a source.
-    
+
     Implementations should yield LineResult objects, handling errors gracefully
     by yielding Err values instead of raising exceptions.
-    
+
     Examples:
         >>> from dataclasses import dataclass
         >>> from result import Ok
         >>> from bsce_mgrep.domain.types import Line
-        >>> 
+        >>>
         >>> @dataclass
-        >>> class DummyReader:
+        ... class DummyReader:
         ...     def read_lines(self) -> Iterator[LineResult]:
         ...         yield Ok(Line(1, "test"))
-        >>> 
+        >>>
         >>> reader: SourceReader = DummyReader()
         >>> lines = list(reader.read_lines())
         >>> len(lines)
         1
     """
-    
+
     def read_lines(self) -> Iterator[LineResult]:
         """Read lines from source, yielding Results.
-        
+
         Yields:
             Ok(Line) for successful reads
             Err(str) for errors (file not found, permission denied, etc.)
-            
+
         Note:
             Should not raise exceptions - all errors should be yielded as Err.
         """
         ...
+
+    def iter_lines(self) -> Result[Iterator[Line], str]:
+        """Open the source once and return an iterator of bare Lines.
+
+        Unboxed fast path used by the runner: setup errors are reported once
+        as Err, and lines are yielded without a per-line Result wrapper.
+
+        Returns:
+            Ok(iterator of Line) or Err(message) if the source cannot be opened
+
+        Note:
+            Errors while iterating (I/O, decoding) are raised as exceptions
+            and must be handled by the caller.
+        """
+        ...
+
+    def iter_line_batches(self) -> Result[Iterator[LineBatch], str]:
+        """Open the source once and return an iterator of LineBatches.
+
+        Batched variant of iter_lines for batch matchers: each batch holds
+        the decoded lines of one raw block, so no Line object is built per
+        input line.
+
+        Returns:
+            Ok(iterator of LineBatch) or Err(message) if the source cannot be opened
+
+        Note:
+            Errors while iterating (I/O, decoding) are raised as exceptions
+            and must be handled by the caller.
+        """
+        ...
+
+    def iter_blocks(self) -> Result[Iterator[bytes], str]:
+        """Open the source once and return an iterator of raw line blocks.
+
+        Each block holds whole lines (newlines included), so bulk scanners
+        can search many lines per call and decode only the lines they keep.
+
+        Returns:
+            Ok(iterator of byte blocks) or Err(message) if the source cannot be opened
+
+        Note:
+            Read errors while iterating are raised as exceptions.
+        """
+        ...
+
+    @property
+    def encoding(self) -> str:
+        """Name of the encoding used to decode raw lines."""
+        ...
+
+    def decode(self, raw: bytes) -> str:
+        """Decode one raw line exactly as iter_lines would."""
+        ...
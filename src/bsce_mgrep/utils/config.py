@@ -0,0 +1,4 @@
+"""Process-wide tuning constants shared across modules."""
+
+# Upper bound on distinct patterns/matchers kept alive per process
+CACHE_SIZE = 256
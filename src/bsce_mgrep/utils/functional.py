@@ -14,26 +14,39 @@ D = TypeVar('D')
 
 def pipe(*functions: Callable) -> Callable:
     """Compose functions left-to-right (Unix pipe style).
-    
+
     Applies functions in sequence, passing output of each as input to the next.
     This is the natural reading order for data transformations.
-    
+
     Args:
         *functions: Variable number of unary functions to compose
-        
+
     Returns:
         A function that applies all functions in sequence
-        
+
     Examples:
         >>> add_one = lambda x: x + 1
         >>> double = lambda x: x * 2
         >>> f = pipe(add_one, double)
         >>> f(5)
         12
-        
+
     Note:
         pipe(f, g, h)(x) ≡ h(g(f(x)))
+
+        Up to three functions are chained as nested calls, without a loop
+        per invocation; a single function is returned as is.
     """
+    match functions:
+        case ():
+            return identity
+        case (f,):
+            return f
+        case (f, g):
+            return lambda arg: g(f(arg))
+        case (f, g, h):
+            return lambda arg: h(g(f(arg)))
+
     def piped(arg):
         result = arg
         for func in functions:
@@ -43,44 +56,39 @@ def pipe(*functions: Callable) -> Callable:
 
 def compose(*functions: Callable) -> Callable:
     """Compose functions right-to-left (mathematical style).
-    
+
     Applies functions in reverse order of arguments. This follows mathematical
     function composition notation: (f ∘ g)(x) = f(g(x))
-    
+
     Args:
         *functions: Variable number of unary functions to compose
-        
+
     Returns:
         A function that applies all functions right-to-left
-        
+
     Examples:
         >>> add_one = lambda x: x + 1
         >>> double = lambda x: x * 2
         >>> f = compose(double, add_one)
         >>> f(5)
         12
-        
+
     Note:
         compose(f, g, h)(x) ≡ f(g(h(x)))
     """
-    def composed(arg):
-        result = arg
-        for func in reversed(functions):
-            result = func(result)
-        return result
-    return composed
+    return pipe(*reversed(functions))
 
 def identity(x: A) -> A:
     """Identity function - returns its argument unchanged.
-    
+
     Useful as a default function or for testing function composition.
-    
+
     Args:
         x: Any value
-        
+
     Returns:
         The same value unchanged
-        
+
     Examples:
         >>> identity(42)
         42
@@ -91,13 +99,13 @@ def identity(x: A) -> A:
 
 def const(value: A) -> Callable[[B], A]:
     """Create a constant function that always returns the same value.
-    
+
     Args:
         value: The value to return
-        
+
     Returns:
         A function that ignores its argument and returns value
-        
+
     Examples:
         >>> always_five = const(5)
         >>> always_five(100)
@@ -111,16 +119,16 @@ def const(value: A) -> Callable[[B], A]:
 
 def curry2(func: Callable[[A, B], C]) -> Callable[[A], Callable[[B], C]]:
     """Curry a two-argument function.
-    
+
     Transforms a function that takes two arguments into a function that takes
     one argument and returns a function that takes the second argument.
-    
+
     Args:
         func: A binary function to curry
-        
+
     Returns:
         A curried version of the function
-        
+
     Examples:
         >>> def add(x: int, y: int) -> int:
         ...     return x + y
@@ -137,13 +145,13 @@ def curry2(func: Callable[[A, B], C]) -> Callable[[A], Callable[[B], C]]:
 
 def flip(func: Callable[[A, B], C]) -> Callable[[B, A], C]:
     """Flip the order of arguments for a binary function.
-    
+
     Args:
         func: A binary function
-        
+
     Returns:
         A function with arguments in reverse order
-        
+
     Examples:
         >>> def divide(x: int, y: int) -> float:
         ...     return x / y
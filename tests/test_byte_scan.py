@@ -0,0 +1,55 @@
+"""Tests for byte-mode regex scanning."""
+
+import pytest
+
+from bsce_mgrep.domain.byte_scan import compile_byte_regex, scan_regex_lines
+from bsce_mgrep.domain.matcher import MatchConfig, create_line_matcher
+from bsce_mgrep.domain.types import Line
+
+# ASCII information separators: whitespace for str regexes, not for bytes regexes
+SEPARATORS = ["\x1c", "\x1d", "\x1e", "\x1f"]
+
+
+def scan(pattern: str, lines: list[str]) -> list[str]:
+    """Return the contents of the lines byte mode reports as matching."""
+    config = MatchConfig(pattern=pattern, case_sensitive=True)
+    regex = compile_byte_regex(config)
+    raw_lines = iter([line.encode("utf-8") for line in lines])
+    return [context.line.content for context in scan_regex_lines(raw_lines, regex, config)]
+
+
+def scan_text(pattern: str, lines: list[str]) -> list[str]:
+    """Return the contents of the lines the text matcher reports as matching."""
+    match = create_line_matcher(MatchConfig(pattern=pattern, case_sensitive=True))
+    return [
+        line for number, line in enumerate(lines, start=1)
+        if match(Line(number, line)) is not None
+    ]
+
+
+@pytest.mark.parametrize("separator", SEPARATORS)
+def test_whitespace_class_matches_information_separators(separator: str) -> None:
+    line = f"a{separator}b"
+    assert scan(r"/a\sb/", [line]) == [line]
+    assert scan(r"/a\sb/", [line]) == scan_text(r"/a\sb/", [line])
+
+
+@pytest.mark.parametrize("separator", SEPARATORS)
+def test_non_whitespace_class_skips_information_separators(separator: str) -> None:
+    line = f"a{separator}b"
+    assert scan(r"/a\Sb/", [line]) == []
+    assert scan(r"/a\Sb/", [line]) == scan_text(r"/a\Sb/", [line])
+
+
+def test_separators_do_not_divert_patterns_without_whitespace_class() -> None:
+    lines = ["code=500\x1cx", "code=200"]
+    assert scan(r"/code=5\d+/", lines) == ["code=500\x1cx"]
+
+
+def test_groups_are_decoded() -> None:
+    config = MatchConfig(pattern=r"/code=(?P<code>\d+)/", case_sensitive=True)
+    regex = compile_byte_regex(config)
+    contexts = list(scan_regex_lines(iter([b"code=500", b"ok"]), regex, config))
+    assert [(context.line.number, context.groups) for context in contexts] == [
+        (1, {"code": "500"})
+    ]
@@ -0,0 +1,37 @@
+"""Tests for the file reader."""
+
+from pathlib import Path
+
+import pytest
+
+from bsce_mgrep.adapters.input import file_reader
+from bsce_mgrep.adapters.input.file_reader import FileReader
+
+# CRLF endings are stripped; a lone CR is not a line break
+CONTENT = b"ERROR a\r\nok\rERROR b\r\nERROR c"
+LINES = ["ERROR a", "ok\rERROR b", "ERROR c"]
+
+
+def read_all(reader: FileReader) -> list[str]:
+    """Return the content of every line read_lines yields."""
+    return [result.unwrap().content for result in reader.read_lines()]
+
+
+@pytest.mark.parametrize("mapped", [False, True])
+def test_read_lines_line_endings(
+    mapped: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "endings.log"
+    source.write_bytes(CONTENT)
+    if mapped:
+        monkeypatch.setattr(file_reader, "MMAP_THRESHOLD", 0)
+
+    assert read_all(FileReader(filepath=str(source))) == LINES
+
+
+def test_line_batches_line_endings(tmp_path: Path) -> None:
+    source = tmp_path / "endings.log"
+    source.write_bytes(CONTENT)
+
+    batches = FileReader(filepath=str(source)).iter_line_batches().unwrap()
+    assert [line for batch in batches for line in batch.contents] == LINES
@@ -0,0 +1,103 @@
+"""Tests for Hyperscan prefiltering."""
+
+from pathlib import Path
+
+import pytest
+
+from bsce_mgrep.cli.parser import CLIArgs
+from bsce_mgrep.cli.runner import run
+from bsce_mgrep.domain.hyperscan_scan import compile_hyperscan, scan_candidate_lines
+from bsce_mgrep.domain.matcher import MatchConfig, create_line_matcher
+from bsce_mgrep.domain.types import Line
+
+LINES = ["aab", "b", "x{,3}b", "[a]", "ERROR 500", "error\x1c500", "café 500"]
+
+
+def matches(pattern: str, lines: list[str]) -> list[str]:
+    """Return the lines the text matcher reports as matching."""
+    match = create_line_matcher(MatchConfig(pattern=pattern, case_sensitive=True))
+    return [
+        line for number, line in enumerate(lines, start=1)
+        if match(Line(number, line)) is not None
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "/a{,3}b/",  # re: up to three a's; Hyperscan: a literal "{,3}"
+        "/x{,}b/",  # re: x*b
+        "/[[:alpha:]]+/",  # re: a set holding "[:alph", then "]+"
+        "/[[.a.]]/",
+        "/[[=a=]]/",
+        "/[:a]/",  # rejected too: telling sets from POSIX classes is not worth it
+        "/^$/",  # match empty lines
+        "/$/",
+        "/^a*$/",
+        "/\\Aaab/",  # string anchors
+        "/b\\Z/",
+    ],
+)
+def test_unsupported_patterns_are_rejected(pattern: str) -> None:
+    with pytest.raises(ValueError, match="not supported by Hyperscan"):
+        compile_hyperscan(MatchConfig(pattern=pattern, case_sensitive=True))
+
+
+@pytest.mark.parametrize("pattern", ["/a\\Q.\\E/", "/a{2,1}/"])
+def test_patterns_invalid_for_re_are_rejected(pattern: str) -> None:
+    with pytest.raises(ValueError, match="Invalid regex pattern"):
+        compile_hyperscan(MatchConfig(pattern=pattern, case_sensitive=True))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["/a\\{,3}b/", "/x{1,}b/", "/[a\\[:]/", "/(?P<code>\\d{3})/", "/error\\s500/", "ERROR"],
+)
+def test_candidates_include_every_match(pattern: str) -> None:
+    pytest.importorskip("hyperscan")
+    database = compile_hyperscan(MatchConfig(pattern=pattern, case_sensitive=True))
+    block = "\n".join(LINES).encode("utf-8")
+
+    candidates = [line.content for line in scan_candidate_lines(iter([block]), database)]
+    assert set(matches(pattern, LINES)) <= set(candidates)
+
+
+def test_candidates_skip_lines_that_cannot_match() -> None:
+    pytest.importorskip("hyperscan")
+    database = compile_hyperscan(MatchConfig(pattern="/\\d{3}/", case_sensitive=True))
+    block = "\n".join(LINES).encode("utf-8")
+
+    # Lines with non-ASCII bytes or separators are always passed on
+    candidates = scan_candidate_lines(iter([block]), database)
+    assert [(line.number, line.content) for line in candidates] == [
+        (5, "ERROR 500"), (6, "error\x1c500"), (7, "café 500")
+    ]
+
+
+def test_zero_width_match_at_line_start() -> None:
+    pytest.importorskip("hyperscan")
+    database = compile_hyperscan(MatchConfig(pattern="/^\\b/", case_sensitive=True))
+
+    candidates = scan_candidate_lines(iter([b"-\na\n-b\n"]), database)
+    assert [(line.number, line.content) for line in candidates] == [(2, "a")]
+
+
+@pytest.mark.parametrize("pattern", ["/^$/", "/^a*$/", "/$/"])
+def test_hyperscan_engine_reports_empty_lines(
+    pattern: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    pytest.importorskip("hyperscan")
+    source = tmp_path / "empty.log"
+    source.write_bytes(b"a\n\nb\n\n")
+
+    outputs = []
+    for engine in ("re", "hyperscan"):
+        args = CLIArgs(
+            source=str(source), pattern=pattern, case_sensitive=True, where_clauses=[],
+            show_line_numbers=True, engine=engine
+        )
+        assert run(args).is_ok()
+        outputs.append(capsys.readouterr().out)
+
+    assert outputs[1] == outputs[0]
+    assert "2:\n" in outputs[1] and "4:\n" in outputs[1]
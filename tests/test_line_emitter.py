@@ -0,0 +1,41 @@
+"""Tests for the stdout line emitter."""
+
+from collections.abc import Callable
+
+import pytest
+from result import Err, Ok
+
+from bsce_mgrep.adapters.output.line_emitter import LineEmitter
+from bsce_mgrep.domain.types import NO_GROUPS, Line, MatchContext
+
+CONTEXTS = [
+    MatchContext(Line(3, "ERROR: a"), NO_GROUPS),
+    MatchContext(Line(7, "ERROR: b"), NO_GROUPS),
+]
+
+
+def push_contexts(emit: Callable[[MatchContext], object], report: Callable[[str], object]) -> None:
+    """Producer for emit_from that pushes every context in CONTEXTS."""
+    for context in CONTEXTS:
+        emit(context)
+
+
+@pytest.mark.parametrize(
+    ("show_line_numbers", "expected"),
+    [(False, "ERROR: a\nERROR: b\n"), (True, "3:ERROR: a\n7:ERROR: b\n")],
+)
+def test_show_line_numbers(
+    show_line_numbers: bool, expected: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    emitter = LineEmitter(show_line_numbers=show_line_numbers)
+    emitter.emit(Ok(context) for context in CONTEXTS)
+    assert capsys.readouterr().out == expected
+
+    emitter.emit_from(push_contexts)
+    assert capsys.readouterr().out == expected
+
+
+def test_errors_follow_preceding_matches(capsys: pytest.CaptureFixture[str]) -> None:
+    LineEmitter().emit(iter([Ok(CONTEXTS[0]), Err("bad line")]))
+    captured = capsys.readouterr()
+    assert (captured.out, captured.err) == ("ERROR: a\n", "Error: bad line\n")
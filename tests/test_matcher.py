@@ -0,0 +1,151 @@
+"""Tests for pattern matchers."""
+
+from collections.abc import Iterator
+
+import pytest
+from result import Ok
+
+from bsce_mgrep.domain import matcher
+from bsce_mgrep.domain.matcher import (
+    AHO_CORASICK_THRESHOLD,
+    MatchConfig,
+    RegexEngine,
+    compose_patterns,
+    create_batch_matcher,
+    create_line_matcher,
+)
+from bsce_mgrep.domain.types import NO_GROUPS, Line, LineBatch
+
+LINES = ["alice login failed", "bob logout", "carol login denied", "login"]
+
+
+@pytest.fixture
+def without_re_parser(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Hide re's private parser, clearing the caches that depend on it."""
+    caches = (matcher._required_literal, create_batch_matcher)
+    for cached in caches:
+        cached.cache_clear()
+    monkeypatch.setattr(matcher, "_parser", None)
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+def batch_matches(pattern: str) -> list[tuple[int, str]]:
+    """Return (number, content) of the lines a batch matcher reports."""
+    match = create_batch_matcher(MatchConfig(pattern=pattern, case_sensitive=True))
+    contexts = match(LineBatch(range(1, len(LINES) + 1), LINES))
+    return [(context.line.number, context.line.content) for context in contexts]
+
+
+@pytest.mark.usefixtures("without_re_parser")
+def test_required_literal_without_re_parser() -> None:
+    assert matcher._required_literal(r"(\w+) login (failed|denied)", 0) == ""
+
+
+@pytest.mark.usefixtures("without_re_parser")
+def test_batch_matcher_without_re_parser() -> None:
+    assert batch_matches(r"/(?P<user>\w+) login (failed|denied)/") == [
+        (1, "alice login failed"), (3, "carol login denied")
+    ]
+
+
+def test_literal_matches_share_read_only_groups() -> None:
+    match = create_batch_matcher(MatchConfig(pattern="login", case_sensitive=True))
+    contexts = match(LineBatch(range(1, len(LINES) + 1), LINES))
+    assert all(context.groups is NO_GROUPS for context in contexts)
+    with pytest.raises(TypeError):
+        contexts[0].groups["user"] = "mallory"  # type: ignore[index]
+
+
+# Lines on which RE2 and re read some patterns differently
+UNICODE_LINES = ["ǅ=1", "x٣", "a\u2003b", "[:]", "aab", "a{,2}"]
+
+RE2_DIVERGENT_PATTERNS = [
+    "/(?P<u>\\w+)=/",  # RE2's \w, \d, \s and \b are ASCII-only
+    "/x\\d/",
+    "/a\\sb/",
+    "/\\b\\S+/",
+    "/[[:alpha:]]/",  # a POSIX class to RE2, a nested set to re
+    "/a{,2}/",  # literal text to RE2
+]
+
+
+def engine_matches(pattern: str, engine: RegexEngine) -> list[str]:
+    """Return the lines a line matcher using the engine reports as matching."""
+    config = MatchConfig(pattern=pattern, case_sensitive=True, engine=engine)
+    match = create_line_matcher(config)
+    return [
+        line for number, line in enumerate(UNICODE_LINES, start=1)
+        if match(Line(number, line)) is not None
+    ]
+
+
+@pytest.mark.parametrize("pattern", RE2_DIVERGENT_PATTERNS)
+def test_re2_skips_divergent_patterns(pattern: str) -> None:
+    options = matcher.pattern_options(pattern, True)
+    assert matcher._compile_re2(options.source, options.flags) is None
+
+
+@pytest.mark.parametrize("pattern", [*RE2_DIVERGENT_PATTERNS, "/a\\{,2}/", "/(?P<c>[0-9]+)/"])
+def test_re2_engine_matches_re(pattern: str) -> None:
+    pytest.importorskip("re2")
+    assert engine_matches(pattern, "re2") == engine_matches(pattern, "re")
+
+
+def test_re2_compiles_equivalent_patterns() -> None:
+    pytest.importorskip("re2")
+    options = matcher.pattern_options("/a\\{,2}|(?P<c>[0-9]+)/", True)
+    assert matcher._compile_re2(options.source, options.flags) is not None
+
+
+COMPOSE_LINES = [
+    "ERROR: disk full", "error: lower case", "Warn: low memory", "WARN: low memory",
+    "INFO: ok", "code=017 timeout", "code=117", "code=042 retry", "", "status=500",
+]
+
+
+def assert_compose_matches_each_pattern(configs: list[MatchConfig]) -> None:
+    """Check compose_patterns matches a line iff some pattern matches it alone."""
+    composite = compose_patterns(configs)
+    line_matchers = [create_line_matcher(config) for config in configs]
+
+    for number, content in enumerate(COMPOSE_LINES, start=1):
+        line = Line(number, content)
+        expected = any(match(line) is not None for match in line_matchers)
+        result = composite(line)
+        assert isinstance(result, Ok) == expected, content
+        if expected:
+            assert result.unwrap().line == line
+
+
+def test_compose_literals_with_mixed_case_sensitivity_and_duplicates() -> None:
+    assert_compose_matches_each_pattern([
+        MatchConfig(pattern="ERROR", case_sensitive=True),
+        MatchConfig(pattern="warn", case_sensitive=False),
+        MatchConfig(pattern="ERROR", case_sensitive=True),
+        MatchConfig(pattern="Error", case_sensitive=False),
+        MatchConfig(pattern="warn", case_sensitive=False),
+    ])
+
+
+def test_compose_with_regex_falls_back_to_one_matcher_per_pattern() -> None:
+    assert_compose_matches_each_pattern([
+        MatchConfig(pattern="WARN", case_sensitive=True),
+        MatchConfig(pattern="/status=5\\d\\d/", case_sensitive=True),
+        MatchConfig(pattern="disk", case_sensitive=False),
+    ])
+
+
+def test_compose_many_literals_with_aho_corasick() -> None:
+    pytest.importorskip("ahocorasick")
+    needles = [f"code={number:03d}" for number in range(20, 60)]
+    assert len(needles) >= AHO_CORASICK_THRESHOLD
+    configs = [MatchConfig(pattern=needle, case_sensitive=True) for needle in needles]
+
+    assert_compose_matches_each_pattern([
+        *configs, *configs[:5], MatchConfig(pattern="Code=017", case_sensitive=False)
+    ])
+    assert_compose_matches_each_pattern([
+        MatchConfig(pattern=needle.upper(), case_sensitive=False) for needle in needles
+    ])
@@ -0,0 +1,17 @@
+"""Tests for command-line parsing."""
+
+import pytest
+from result import Err
+
+from bsce_mgrep.cli.parser import parse_args
+
+
+@pytest.mark.parametrize("option", ["--match", "--case", "--where", "--engine"])
+def test_missing_option_value_is_an_error(option: str) -> None:
+    argv = ["app.log", "--match", "ERROR", option]
+    assert parse_args(argv) == Err("Invalid arguments")
+
+
+def test_option_like_value_is_an_error() -> None:
+    assert parse_args(["app.log", "--match", "--where"]) == Err("Invalid arguments")
+
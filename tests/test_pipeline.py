@@ -0,0 +1,48 @@
+"""Tests for pipeline composition."""
+
+import pytest
+
+from bsce_mgrep.domain.matcher import MatchConfig, create_batch_matcher, create_line_matcher
+from bsce_mgrep.domain.pipeline import iter_batches
+from bsce_mgrep.domain.types import Line
+
+LINES = [
+    "ERROR: disk full", "error: lower case", "", "INFO: ok", "status=500 code=E42",
+    "status=200", "café ERROR", "  indented", "ERROR", "WARN ERROR: retry",
+]
+
+PATTERNS = [
+    "error",  # case-insensitive literal
+    "/^ERROR/",  # anchors hold at every line start in joined batches
+    "/ERROR$/",
+    "/\\AERROR/",  # string anchor: unsafe in joined text
+    "/^$/",
+    "/status=(?P<code>\\d+)/",  # named groups
+    "/ERROR(?!:)/",  # negative lookahead can see the next line when joined
+    "/(?<=WARN )ERROR/",
+    "/\\s+\\w+$/",
+]
+
+
+def line_matches(pattern: str) -> list[tuple[int, str, dict[str, str]]]:
+    """Return (number, content, groups) of each line matched on its own."""
+    match = create_line_matcher(MatchConfig(pattern=pattern, case_sensitive=False))
+    contexts = (match(Line(number, content)) for number, content in enumerate(LINES, start=1))
+    return [
+        (context.line.number, context.line.content, dict(context.groups))
+        for context in contexts if context is not None
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 3, 4096])
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_batched_matching_equals_per_line_matching(pattern: str, size: int) -> None:
+    match_batch = create_batch_matcher(MatchConfig(pattern=pattern, case_sensitive=False))
+    lines = (Line(number, content) for number, content in enumerate(LINES, start=1))
+
+    batched = [
+        (context.line.number, context.line.content, dict(context.groups))
+        for batch in iter_batches(lines, size)
+        for context in match_batch(batch)
+    ]
+    assert batched == line_matches(pattern)
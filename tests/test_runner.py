@@ -0,0 +1,79 @@
+"""Tests for the CLI runner."""
+
+import os
+from pathlib import Path
+
+import pytest
+from result import Err
+
+from bsce_mgrep.cli import runner
+from bsce_mgrep.cli.parser import CLIArgs
+from bsce_mgrep.cli.runner import run
+
+
+def test_encoding_error_after_earlier_matches(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "bad.log"
+    source.write_bytes(b"ERROR ok\nbad \xff ERROR\nERROR 2\n")
+    args = CLIArgs(
+        source=str(source), pattern="/o/", case_sensitive=True,
+        where_clauses=["line.length > 0"]
+    )
+
+    assert run(args) == Err(
+        "Encoding error: 'utf-8' codec can't decode byte 0xff in position 4: "
+        "invalid start byte"
+    )
+    assert capsys.readouterr().out == "ERROR ok\n"
+
+
+@pytest.mark.parametrize(
+    ("pattern", "case_sensitive"),
+    [
+        ("status=500", True),  # bulk literal scan
+        ("error", False),  # bulk literal scan, lowered blocks
+        ("/status=5\\d\\d/", True),  # byte-mode regex
+    ],
+)
+def test_encoding_error_in_non_matching_line(
+    pattern: str, case_sensitive: bool, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "bad.log"
+    source.write_bytes(b"ok\nbad \xff line\nok\n")
+    args = CLIArgs(
+        source=str(source), pattern=pattern, case_sensitive=case_sensitive, where_clauses=[],
+        byte_mode=True
+    )
+
+    assert run(args) == Err(
+        "Encoding error: 'utf-8' codec can't decode byte 0xff in position 4: "
+        "invalid start byte"
+    )
+    assert capsys.readouterr().out == ""
+
+
+def test_sharded_run_matches_sequential_run(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "big.log"
+    source.write_bytes(b"".join(
+        b"%d status=%d\n" % (number, 500 if number % 7 == 0 else 200)
+        for number in range(1, 5001)
+    ))
+    args = CLIArgs(
+        source=str(source), pattern="/status=5\\d\\d/", case_sensitive=True,
+        where_clauses=[], show_line_numbers=True
+    )
+
+    assert run(args).is_ok()
+    sequential = capsys.readouterr().out
+
+    # Many small shards: more than the workers keep in flight
+    monkeypatch.setattr(runner, "PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(runner, "SHARD_SIZE", 1 << 10)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    assert run(args).is_ok()
+    assert capsys.readouterr().out == sequential
+    assert sequential.splitlines()[0] == "7:7 status=500"
@@ -0,0 +1,39 @@
+"""Tests for the where-clause interpreter and compiler."""
+
+import pytest
+from result import Err, Ok
+
+from bsce_mgrep.domain.types import Line, MatchContext
+from bsce_mgrep.domain.where_parser import (
+    compile_predicate,
+    evaluate_where,
+    parse_where_expression,
+)
+
+CONTEXT = MatchContext(line=Line(1, "ERROR: disk full"), groups={"code": "500"})
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ('1 or group("missing")', True),
+        ('0 and group("missing")', False),
+        ('line.contains("ERROR") or group("missing") == "x"', True),
+        ('not (line.length < 0 and group("missing"))', True),
+    ],
+)
+def test_evaluators_short_circuit_alike(expression: str, expected: bool) -> None:
+    ast = parse_where_expression(expression).unwrap()
+
+    assert evaluate_where(ast, CONTEXT) == Ok(expected)
+    assert compile_predicate([ast])(CONTEXT) is expected
+
+
+def test_evaluators_report_missing_group_when_evaluated() -> None:
+    ast = parse_where_expression('0 or group("missing")').unwrap()
+
+    assert evaluate_where(ast, CONTEXT) == Err(
+        "Evaluation error: Regex group not found: missing"
+    )
+    with pytest.raises(ValueError, match="Regex group not found: missing"):
+        compile_predicate([ast])(CONTEXT)